@@ -0,0 +1,46 @@
+"""
+Пропускная способность пакетного расчета (регионов в секунду) по числу процессов.
+Запуск из каталога app: python -m bench.batch [число_регионов]
+"""
+import sys
+
+from sub.batch import place_regions
+from bench.shapes import SHAPES
+
+TIERS = [(28, 60), (12, 60), (4, 60)]
+JOBS = (1, 2, 4, 8)
+
+
+def make_districts(count: int) -> list:
+    """Районы разной формы и размера, разнесенные по сетке."""
+    kinds = [SHAPES[name] for name in ("convex", "concave", "star")]
+    districts = []
+    for i in range(count):
+        size = 150 + 50 * (i % 5)
+        ring = kinds[i % len(kinds)](size)
+        dx, dy = (i % 10) * 500, (i // 10) * 500
+        districts.append([(x + dx, y + dy) for x, y in ring])
+    return districts
+
+
+def main(count: int = 40):
+    districts = make_districts(count)
+    print(f"Районов: {count}, ярусы {TIERS}")
+
+    reference = None
+    base_rate = None
+    for jobs in JOBS:
+        batch = place_regions(districts, TIERS, jobs=jobs, cache=False)
+        rate = count / batch.elapsed
+        counts = [result["counts"] for result in batch.results]
+        if reference is None:
+            reference = counts
+            base_rate = rate
+        identical = "да" if counts == reference else "НЕТ"
+        print(f"  процессов: {jobs}  время: {batch.elapsed:8.3f} с  регионов/с: {rate:7.2f}  "
+              f"ускорение: {rate / base_rate:5.2f}x  вышки: {batch.summary()['total_towers']}  "
+              f"совпадает с последовательным: {identical}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,36 @@
+"""
+Подбор сдвига и поворота сетки: сколько вышек экономит и сколько стоит.
+Запуск из каталога app: python -m bench.optimize [размер_региона] [процессов]
+"""
+import sys
+import time
+
+from sub.base_region import Region
+from bench.shapes import SHAPES
+
+TIERS = [(28, 60), (12, 60), (4, 60)]
+
+
+def main(size: float = 400, workers: int = 1):
+    print(f"Размер {size}, ярусы {TIERS}, процессов: {workers}")
+    for name in ("convex", "concave", "star"):
+        coords = SHAPES[name](size)
+
+        start = time.perf_counter()
+        base = Region(coords).find_centers_of_tiers(TIERS, cache=False)
+        base_time = time.perf_counter() - start
+
+        region = Region(coords)
+        start = time.perf_counter()
+        region.optimize_tiers(TIERS, workers=workers, cache=False)
+        elapsed = time.perf_counter() - start
+
+        base_total = sum(len(v) for v in base.values())
+        total = region.get_total_number_of_towers()
+        print(f"  {name:<8} вышек: {base_total:6d} -> {total:6d} ({total - base_total:+d})  "
+              f"сетка (fx, fy, угол): {region.lattice}  "
+              f"время: {base_time:.3f} с -> {elapsed:.3f} с")
+
+
+if __name__ == "__main__":
+    main(*(float(arg) for arg in sys.argv[1:2]), *(int(arg) for arg in sys.argv[2:3]))
@@ -0,0 +1,54 @@
+"""
+Сравнение точного и приближенного (по набору точек) расчета покрытия.
+Запуск из каталога app: python -m bench.overlap
+"""
+import math
+import time
+
+from sub.base_region import Region
+
+REGIONS = {
+    "пятиугольник": [(0, 0), (300, 0), (300, 200), (150, 300), (0, 200)],
+    "звезда": [(150 + (150 if k % 2 == 0 else 60) * math.cos(math.pi * k / 8),
+                150 + (150 if k % 2 == 0 else 60) * math.sin(math.pi * k / 8)) for k in range(16)],
+}
+RADII = (28, 12, 4)
+PERCENTS = (60, 60, 60)
+REPEATS = 3
+
+
+MODES = (
+    ("точный", False, "sunflower"),
+    ("подсолнечник", True, "sunflower"),
+    ("Холтон", True, "halton"),
+    ("случайный", True, "random"),
+)
+
+
+def run(coords, approximate: bool, sampler: str):
+    """Запускает полный расчет REPEATS раз, возвращает время и число вышек по ярусам."""
+    times = []
+    counts = []
+    for _ in range(REPEATS):
+        # Новый регион на каждый повтор: повторный расчет на том же регионе берет готовые ярусы
+        region = Region(coords, sampler=sampler)
+        start = time.perf_counter()
+        result = region.find_all_centers_of_towers(*RADII, *PERCENTS, approximate=approximate,
+                                                    cache=False)
+        times.append(time.perf_counter() - start)
+        counts.append(tuple(len(v) for v in result.values()))
+    return min(times), counts
+
+
+def main():
+    for name, coords in REGIONS.items():
+        print(f"Регион: {name}")
+        for label, approximate, sampler in MODES:
+            best, counts = run(coords, approximate, sampler)
+            stable = "да" if len(set(counts)) == 1 else "нет"
+            print(f"  {label:<12} время: {best:8.3f} с  вышки (R1, R2, R3): {counts[0]}  "
+                  f"повторяемость: {stable}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Генераторы синтетических регионов для бенчмарков."""
+import math
+
+import numpy as np
+
+
+def convex(size: float = 1000, vertices: int = 12) -> list[tuple]:
+    """Выпуклый многоугольник, вписанный в эллипс."""
+    return [(size / 2 + size / 2 * math.cos(2 * math.pi * k / vertices),
+             size / 2 + size * 0.4 * math.sin(2 * math.pi * k / vertices)) for k in range(vertices)]
+
+
+def concave(size: float = 1000, teeth: int = 6) -> list[tuple]:
+    """Гребенка: прямоугольное основание с зубцами — много вогнутых углов."""
+    base = size * 0.3
+    width = size / (2 * teeth - 1)
+    coords = [(0, 0), (size, 0)]
+    for k in reversed(range(teeth)):
+        left = 2 * k * width
+        coords += [(left + width, base), (left + width, size), (left, size), (left, base)]
+    return coords[:-1]
+
+
+def star(size: float = 1000, rays: int = 8, inner: float = 0.35) -> list[tuple]:
+    """Звезда с rays лучами; inner — доля внутреннего радиуса."""
+    coords = []
+    for k in range(2 * rays):
+        radius = size / 2 if k % 2 == 0 else size / 2 * inner
+        angle = math.pi * k / rays
+        coords.append((size / 2 + radius * math.cos(angle), size / 2 + radius * math.sin(angle)))
+    return coords
+
+
+def noisy(size: float = 1000, vertices: int = 10_000, seed: int = 0) -> list[tuple]:
+    """Звездный многоугольник с неровной границей и большим числом вершин (как выгрузки ГИС)."""
+    rng = np.random.default_rng(seed)
+    angles = np.linspace(0, 2 * math.pi, vertices, endpoint=False)
+    # Плавная крупная волна плюс мелкий шум по радиусу
+    radius = size / 2 * (0.8 + 0.15 * np.sin(5 * angles) + 0.03 * rng.standard_normal(vertices))
+    xs = size / 2 + radius * np.cos(angles)
+    ys = size / 2 + radius * np.sin(angles)
+    return list(zip(xs.tolist(), ys.tolist()))
+
+
+SHAPES = {
+    "convex": convex,
+    "concave": concave,
+    "star": star,
+    "noisy_10k": noisy,
+}
@@ -0,0 +1,68 @@
+"""
+Время запуска: импорт ядра расчета в новом процессе интерпретатора.
+Запуск из каталога app: python -m bench.startup [--repeat N] [--budget СЕКУНДЫ]
+Проверяет, что импорт ядра не тянет matplotlib, и что медианное время импорта
+не превышает бюджет; при нарушении завершается с кодом 1.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Модули, которые не должны загружаться вместе с ядром
+FORBIDDEN = ("matplotlib",)
+
+# Что импортирует процесс пула или пакетный расчет
+TARGETS = {
+    "sub.base_region": "import sub.base_region",
+    "sub": "import sub",
+    "sub.batch": "import sub.batch",
+}
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+loaded = [name for name in {forbidden!r} if name in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def measure(statement: str, repeat: int) -> tuple:
+    """Медианное время импорта и список загруженных запрещенных модулей."""
+    times = []
+    loaded = ""
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(statement=statement, forbidden=FORBIDDEN)],
+                                cwd=APP_DIR, capture_output=True, text=True, check=True).stdout.split()
+        times.append(float(output[0]))
+        loaded = output[1] if len(output) > 1 else ""
+    return statistics.median(times), loaded
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="число запусков на цель")
+    parser.add_argument("--budget", type=float, default=0.5, help="допустимое медианное время импорта, с")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for name, statement in TARGETS.items():
+        elapsed, loaded = measure(statement, args.repeat)
+        problems = []
+        if loaded:
+            problems.append(f"загружен {loaded}")
+        if elapsed > args.budget:
+            problems.append(f"превышен бюджет {args.budget:.3f} с")
+        failed |= bool(problems)
+        status = "; ".join(problems) if problems else "ok"
+        print(f"  {name:<16} импорт: {elapsed * 1000:8.1f} мс  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Набор бенчмарков конвейера размещения на синтетических регионах.
+Запуск из каталога app:
+    python -m bench.suite [--quick] [--output result.json] [--compare baseline.json]
+Для каждой операции записывает время, пиковую память и число вышек в JSON.
+"""
+import argparse
+from collections.abc import Mapping
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from sub.base_region import ALGORITHM_VERSION, Region
+from bench.shapes import SHAPES
+
+# Доли радиусов r2 / r1 и r3 / r1
+RADIUS_RATIOS = ((1, 0.5, 0.2), (1, 0.3, 0.1))
+PERCENT = 60
+
+
+def measure(func, repeat: int) -> dict:
+    """Лучшее время из repeat запусков и пиковая память отдельного запуска под tracemalloc."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"wall_time_s": best, "peak_memory_bytes": peak, "result": result}
+
+
+def count_towers(result) -> int:
+    if isinstance(result, Mapping):
+        return sum(len(v) for v in result.values())
+    return len(result)
+
+
+def bench_region(shape: str, coords: list[tuple], radii: tuple, repeat: int, calls: int) -> list[dict]:
+    """Замеры всех операций для одного региона и набора радиусов."""
+    r1, r2, r3 = radii
+    region = Region(coords)
+    (min_x, min_y), (max_x, max_y) = region.rectangle
+    rng = np.random.default_rng(0)
+    points = np.column_stack((rng.uniform(min_x, max_x, calls), rng.uniform(min_y, max_y, calls)))
+    point_list = [tuple(p) for p in points.tolist()]
+    circles_r1 = region.pack_circles_hexagonal(r1, PERCENT, as_array=True)
+
+    operations = {
+        "Region.__init__": (lambda: Region(coords), 1),
+        "contains": (lambda: [region.contains(p) for p in point_list], calls),
+        "contains_many": (lambda: region.contains_many(points), calls),
+        "_check_circle_overlap": (
+            lambda: [region._check_circle_overlap(p, r2, 50) for p in point_list[:calls // 10]], calls // 10),
+        "_check_circle_overlap(approximate)": (
+            lambda: [region._check_circle_overlap(p, r2, 50, 16, approximate=True)
+                     for p in point_list[:calls // 10]], calls // 10),
+        "pack_circles_hexagonal": (lambda: region.pack_circles_hexagonal(r1, PERCENT, as_array=True), 1),
+        "pack_secondary_circles": (
+            lambda: region.pack_secondary_circles(r2, PERCENT, circles_r1, r1, as_array=True), 1),
+        # Новый регион на каждый запуск: иначе повторный расчет берет готовые ярусы
+        "find_all_centers_of_towers": (
+            lambda: Region(coords).find_all_centers_of_towers(r1, r2, r3, PERCENT, PERCENT, PERCENT,
+                                                              cache=False), 1),
+    }
+
+    records = []
+    for name, (func, call_count) in operations.items():
+        stats = measure(func, repeat)
+        towers = count_towers(stats["result"]) if name.startswith(("pack", "find")) else None
+        records.append({
+            "shape": shape,
+            "vertices": len(coords),
+            "radii": list(radii),
+            "operation": name,
+            "calls": call_count,
+            "wall_time_s": round(stats["wall_time_s"], 6),
+            "peak_memory_bytes": stats["peak_memory_bytes"],
+            "towers": towers,
+        })
+        print(f"{shape:>10} R={radii} {name:<36} {stats['wall_time_s']:9.4f} с  "
+              f"{stats['peak_memory_bytes'] / 2**20:8.2f} МБ", file=sys.stderr)
+    return records
+
+
+def compare(records: list[dict], baseline_path: str, tolerance: float) -> list[str]:
+    """Операции, ставшие медленнее базового замера больше чем в tolerance раз."""
+    with open(baseline_path, encoding="UTF-8") as file:
+        baseline = json.load(file)["results"]
+    key = lambda rec: (rec["shape"], tuple(rec["radii"]), rec["operation"])
+    previous = {key(rec): rec for rec in baseline}
+    regressions = []
+    for rec in records:
+        old = previous.get(key(rec))
+        if old and rec["wall_time_s"] > old["wall_time_s"] * tolerance:
+            regressions.append(f"{rec['shape']} {rec['radii']} {rec['operation']}: "
+                               f"{old['wall_time_s']:.4f} -> {rec['wall_time_s']:.4f} с")
+        if old and old["towers"] != rec["towers"]:
+            regressions.append(f"{rec['shape']} {rec['radii']} {rec['operation']}: "
+                               f"вышек {old['towers']} -> {rec['towers']}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарки размещения вышек")
+    parser.add_argument("--quick", action="store_true", help="уменьшенные регионы и число повторов")
+    parser.add_argument("--output", help="файл для JSON (по умолчанию stdout)")
+    parser.add_argument("--compare", help="JSON прошлого запуска для поиска регрессий")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="допустимое замедление относительно --compare")
+    args = parser.parse_args(argv)
+
+    size = 400 if args.quick else 1000
+    repeat = 1 if args.quick else 3
+    calls = 1000 if args.quick else 10_000
+    r1 = size / 25
+
+    records = []
+    for shape, generator in SHAPES.items():
+        coords = generator(size)
+        for ratio in RADIUS_RATIOS:
+            radii = tuple(r1 * k for k in ratio)
+            records.extend(bench_region(shape, coords, radii, repeat, calls))
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "algorithm_version": ALGORITHM_VERSION,
+            "size": size,
+            "repeat": repeat,
+        },
+        "results": records,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="UTF-8") as file:
+            file.write(text)
+    else:
+        print(text)
+
+    if args.compare:
+        regressions = compare(records, args.compare, args.tolerance)
+        for line in regressions:
+            print(f"РЕГРЕССИЯ: {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+Масштабирование параллельного расчета по числу процессов (1/2/4/8).
+Запуск из каталога app: python -m bench.workers [сторона_квадрата]
+"""
+import sys
+import time
+
+from sub.base_region import Region
+
+RADII = (28, 12, 4)
+PERCENTS = (60, 60, 60)
+WORKERS = (1, 2, 4, 8)
+
+
+def main(side: float = 4000):
+    coords = [(0, 0), (side, 0), (side, side * 0.8), (side / 2, side), (0, side * 0.8)]
+    print(f"Регион {side}x{side}, радиусы {RADII}")
+
+    reference = None
+    base_time = None
+    for workers in WORKERS:
+        # Новый регион на каждый замер: повторный расчет на том же регионе берет готовые ярусы
+        region = Region(coords)
+        start = time.perf_counter()
+        result = region.find_all_centers_of_towers(*RADII, *PERCENTS, workers=workers,
+                                                    cache=False)
+        elapsed = time.perf_counter() - start
+
+        if reference is None:
+            reference = result
+            base_time = elapsed
+        identical = "да" if result == reference else "НЕТ"
+        counts = tuple(len(v) for v in result.values())
+        print(f"  процессов: {workers}  время: {elapsed:8.3f} с  ускорение: {base_time / elapsed:5.2f}x  "
+              f"вышки: {counts}  совпадает с последовательным: {identical}")
+
+
+if __name__ == "__main__":
+    main(*(float(arg) for arg in sys.argv[1:2]))
@@ -1,7 +1,15 @@
 from sub import Tower
-from sub import parsing_base_station
+from sub import parsing_base_station, load_catalog
 from sub import base_region
+from sub.base_region import _tier_name
+from sub.batch import iter_place_regions, BatchResult
+from sub.export import write_region_results
+from sub.inputs import INPUT_FORMATS, detect_format, read_regions
+import argparse
 import math
+import os
+import sys
+import time
 def read_and_validate_two_numbers(vvod:str) -> tuple:
     try:
         # Считываем строку и разбиваем на части
@@ -28,42 +36,37 @@ def read_and_validate_two_numbers(vvod:str) -> tuple:
     except Exception:
         return False
     
-def chose_rad():
-    b_s:list[Tower] = parsing_base_station()
+def chose_rad(b_s:list[Tower]):
     for i in range(len(b_s)):
         print(f"N: {i}  Название вышки: {b_s[i].name}  Площадь: {b_s[i].square}")
-    n1, n2, n3 = sorted(list(map(int, input("Введите номера вышек(через пробел): ").split())))
-    R1, R2, R3 = math.sqrt(b_s[n1].square/math.pi),math.sqrt(b_s[n2].square/math.pi), math.sqrt(b_s[n3].square/math.pi)
-    return R1, R2, R3
+    numbers = sorted(map(int, input("Введите номера вышек(через пробел): ").split()))
+    # Вышки отсортированы по убыванию площади, поэтому радиусы идут от большего к меньшему
+    return [math.sqrt(b_s[n].square/math.pi) for n in numbers]
 
 def vvod_percent():
-    vvod = input()
-    if vvod.isdigit():
-        return int(vvod)
-    if vvod=="-":
-        return None
-    print("Введите целое число")
-    return vvod_percent()
-
-def create_region(coords, R1, R2, R3):
-    cof_1,cof_2,cof_3=None,None,None
-    print("Введите процент свободы площади для большей Бс (или - для пропуска): ")
-    cof_1 = vvod_percent()
-    if cof_1==None:
-        return base_region.Region(coords, R1, R2, R3)
-    print("Введите процент свободы площади для большей Бс (или - для пропуска): ")
-    cof_2 = vvod_percent()
-    if cof_2==None:
-        return base_region.Region(coords, R1, R2, R3, percent1=cof_1)
-    print("Введите процент свободы площади для большей Бс (или - для пропуска): ")
-    cof_3 = vvod_percent()
-    if cof_2==None:
-        return base_region.Region(coords, R1, R2, R3, percent1=cof_1, percent2=cof_2)
-    return base_region.Region(coords, R1, R2, R3, percent1=cof_1, percent2=cof_2, percent3=cof_3)
+    while True:
+        vvod = input()
+        if vvod.isdigit():
+            return int(vvod)
+        if vvod=="-":
+            return None
+        print("Введите целое число")
+
+def create_region(coords, *radii):
+    # Проценты вводятся по ярусам; после '-' оставшиеся ярусы наследуют предыдущий процент
+    percents = []
+    for i in range(len(radii)):
+        print(f"Введите процент свободы площади для Бс R{i + 1} (или - для пропуска): ")
+        cof = vvod_percent()
+        if cof==None:
+            break
+        percents.append(cof)
+    tiers = [(r, percents[i] if i < len(percents) else None) for i, r in enumerate(radii)]
+    return base_region.Region(coords, tiers=tiers)
 
 def main():
     b_s:list[Tower] = parsing_base_station()
-    R1, R2, R3 = chose_rad()
+    radii = chose_rad(b_s)
     coords:list[tuple[float]] = []
     vvod = ""
     print("Введите координаты (x, y) минимум 3 или '-' для выхода")
@@ -73,9 +76,106 @@ def main():
         if ans:
             coords.append(ans)
         print(f"Введено координат {len(coords)}")
-    region = create_region(coords, R1, R2, R3)
+    region = create_region(coords, *radii)
     print(region)
-    base_region.visualize_towers(region, R1, R2, R3)
+    base_region.visualize_towers(region, *radii)
+
+
+def batch_radii(args) -> list[float]:
+    """Радиусы ярусов из --radii или из номеров вышек каталога --towers (как в интерактивном режиме)."""
+    if args.radii:
+        return sorted(args.radii, reverse=True)
+    # Путь из --catalog считается от текущего каталога, как и входные файлы;
+    # встроенный каталог по умолчанию лежит рядом с приложением
+    catalog = load_catalog(os.path.abspath(args.catalog)) if args.catalog else load_catalog()
+    for n in args.towers:
+        if not 0 <= n < len(catalog):
+            raise ValueError(f"Tower number {n} is out of range 0..{len(catalog) - 1}")
+    # Каталог отсортирован по убыванию площади, поэтому радиусы идут от большего к меньшему
+    return [float(catalog.radii()[n]) for n in sorted(args.towers)]
+
+
+def run_batch(args) -> int:
+    """Пакетный режим: регионы из файлов или stdin, результаты потоком в stdout или файл."""
+    radii = batch_radii(args)
+    percents = args.percents or []
+    tiers = [(r, percents[i] if i < len(percents) else None) for i, r in enumerate(radii)]
+
+    sources = args.inputs or ["-"]
+    ids = []
+
+    def regions():
+        for path in sources:
+            if path == "-":
+                yield from read_regions(sys.stdin, args.input_format or "ndjson")
+                continue
+            with open(path, encoding="utf-8-sig", newline="") as file:
+                yield from read_regions(file, args.input_format or detect_format(path))
+
+    def geometries():
+        for region_id, geometry in regions():
+            ids.append(region_id)
+            yield geometry
+
+    output = sys.stdout if args.output in (None, "-") else open(args.output, "w", encoding="utf-8", newline="")
+    summary_results = []
+    start = time.perf_counter()
+    try:
+        stream = iter_place_regions(geometries(), tiers, approximate=args.approximate, jobs=args.jobs,
+                                    cache=not args.no_cache)
+
+        def labelled():
+            for result in stream:
+                # Для сводки центры не нужны — храним только счетчики
+                summary_results.append({key: value for key, value in result.items() if key != "centers"})
+                yield ids[result["index"]], result
+
+        write_region_results(labelled(), output, args.format)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if args.summary:
+        elapsed = time.perf_counter() - start
+        print(BatchResult(summary_results, [_tier_name(i) for i in range(len(tiers))], elapsed), file=sys.stderr)
+    return 1 if any("error" in result for result in summary_results) else 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Размещение базовых станций в регионе. "
+                                                 "Без подкоманды запускается интерактивный режим.")
+    commands = parser.add_subparsers(dest="command")
+    batch = commands.add_parser("batch", help="пакетный расчет регионов из файлов или stdin")
+    batch.add_argument("inputs", nargs="*",
+                       help="файлы регионов (.geojson/.json, .ndjson/.jsonl, .csv); '-' или пусто — stdin")
+    batch.add_argument("--input-format", choices=INPUT_FORMATS,
+                       help="формат входа (по умолчанию по расширению, для stdin — ndjson)")
+    tiers = batch.add_mutually_exclusive_group(required=True)
+    tiers.add_argument("--towers", type=int, nargs="+", metavar="N",
+                       help="номера вышек каталога (N из интерактивного списка)")
+    tiers.add_argument("--radii", type=float, nargs="+", metavar="R", help="радиусы ярусов напрямую")
+    batch.add_argument("--catalog", help="CSV каталога вышек (по умолчанию встроенный Базовыестанции.csv)")
+    batch.add_argument("--percents", type=int, nargs="+", metavar="P",
+                       help="проценты по ярусам; недостающие наследуют предыдущий")
+    batch.add_argument("--format", choices=("ndjson", "csv"), default="ndjson", help="формат вывода")
+    batch.add_argument("--output", "-o", help="файл вывода (по умолчанию stdout)")
+    batch.add_argument("--jobs", "-j", type=int, default=1, help="число процессов")
+    batch.add_argument("--approximate", action="store_true", help="приближенная оценка покрытия")
+    batch.add_argument("--no-cache", action="store_true", help="не использовать дисковый кэш")
+    batch.add_argument("--summary", action="store_true", help="вывести сводку в stderr")
+    return parser.parse_args(argv)
 
 
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    args = parse_args()
+    if args.command == "batch":
+        try:
+            sys.exit(run_batch(args))
+        except BrokenPipeError:
+            # Читатель закрыл вывод раньше (например, | head): дописывать некуда
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            sys.exit(1)
+        except (OSError, ValueError, KeyError) as error:
+            print(f"Ошибка: {error}", file=sys.stderr)
+            sys.exit(2)
+    main()
\ No newline at end of file
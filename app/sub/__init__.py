@@ -1,2 +1,12 @@
-from .tower import Tower, parsing_base_station
-from .base_region import Region, visualize_towers
\ No newline at end of file
+from .tower import Tower, TowerCatalog, load_catalog, parsing_base_station
+from .base_region import Region
+from .layout import TowerLayout
+from .batch import place_regions, tiers_from_towers, BatchResult
+
+
+def __getattr__(name):
+    # matplotlib загружается только при первом обращении к отрисовке
+    if name == "visualize_towers":
+        from .render import visualize_towers
+        return visualize_towers
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
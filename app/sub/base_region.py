@@ -1,47 +1,209 @@
+import heapq
+import itertools
 import math
-import random
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle, Polygon
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+import numpy as np
+from .geometry import circle_polygon_area, circle_intersection_area
+from .spatial_index import GridIndex
+from .cache import get_default_cache
+from .sampling import DiskSampler
+from .stats import PlacementStats
+from .polygon_index import PolygonIndex, INSIDE, OUTSIDE
+from .coverage import coverage_metrics
+from .optimize import place_layout, search_layout
+from .layout import TowerLayout, _tier_name
+
+# Число точек по ярусам для приближенного режима. Равномерный набор точек
+# (см. DiskSampler) дает при этом меньше ошибочных решений, чем 50/30/20 случайных
+TIER_ACCURACY = (24, 16, 12)
+
+# Версия алгоритма размещения; увеличивается при любом изменении результата (входит в ключ кэша)
+ALGORITHM_VERSION = 1
+
+
+def _accumulate(start: float, step: float, stop: float) -> np.ndarray:
+    """
+    Значения start, start + step, ... не больше stop.
+    Складывает шаг последовательно (как цикл с +=), чтобы координаты совпадали бит-в-бит.
+    """
+    if start > stop:
+        return np.empty(0)
+    count = int((stop - start) // step) + 2
+    values = np.cumsum(np.concatenate(([start], np.full(count - 1, step, dtype=np.float64))))
+    return values[values <= stop]
+
+
+def _validate_radii(radii: list[float]) -> None:
+    if not radii:
+        raise ValueError("At least one tier is required.")
+    if any(r <= 0 for r in radii):
+        raise ValueError("Radii must be positive values.")
+    if any(prev < r for prev, r in zip(radii, radii[1:])):
+        raise ValueError("Radii must be sorted from largest to smallest (R1 >= R2 >= ...).")
+
+
+def _ring_area(ring) -> float:
+    """Ориентированная площадь кольца по формуле Гаусса (положительна при обходе против часовой)."""
+    n = len(ring)
+    area = 0.0
+    for i in range(n):
+        j = (i + 1) % n
+        area += ring[i][0] * ring[j][1]
+        area -= ring[j][0] * ring[i][1]
+    return area / 2.0
+
+
+def _tier_accuracy(tier_index: int) -> int:
+    """Число случайных точек для яруса; ярусы после третьего используют последнее значение."""
+    return TIER_ACCURACY[min(tier_index, len(TIER_ACCURACY) - 1)]
+
+
+def _resolve_percents(tiers: list[tuple], default: int = 70) -> list[tuple]:
+    """Ярусы (радиус, процент): процент None наследуется от предыдущего яруса, у первого — default."""
+    resolved = []
+    percent = default
+    for r, tier_percent in tiers:
+        percent = tier_percent if tier_percent is not None else percent
+        resolved.append((r, percent))
+    return resolved
+
+
+def _as_tuples(centers: np.ndarray) -> list[tuple]:
+    """Список кортежей (x, y) для обратной совместимости."""
+    return [tuple(point) for point in centers.tolist()]
+
+
+# Состояние процесса пула: регион и препятствия передаются один раз при запуске
+_worker_state = {}
+
+
+def _init_worker(region, obstacles):
+    _worker_state['region'] = region
+    _worker_state['obstacles'] = obstacles
+
+
+def _evaluate_band(r_new, percent, accuracy, approximate, row_start, row_stop):
+    """
+    Проверяет полосу строк сетки в процессе пула.
+    Возвращает центры и счетчики полосы (None, если инструментирование выключено).
+    """
+    region = _worker_state['region']
+    if region.stats is not None:
+        region.stats.reset()
+    centers = region._evaluate_lattice(r_new, percent, _worker_state['obstacles'],
+                                       accuracy, approximate, row_start, row_stop)
+    return centers, (region.stats.counters if region.stats is not None else None)
+
+
+class _ObstacleWindow:
+    """
+    Скользящее окно по потоку строк предыдущего яруса.
+    Держит в памяти только строки, чьи y попадают в [y - reach, y + reach].
+    """
+    def __init__(self, rows):
+        self._rows = rows
+        self._window = deque()
+        self._exhausted = False
+
+    def advance(self, y: float, reach: float) -> np.ndarray:
+        """Возвращает центры препятствий рядом со строкой y в исходном порядке."""
+        while not self._exhausted and (not self._window or self._window[-1][0] <= y + reach):
+            try:
+                self._window.append(next(self._rows))
+            except StopIteration:
+                self._exhausted = True
+        while self._window and self._window[0][0] < y - reach:
+            self._window.popleft()
+        if not self._window:
+            return np.empty((0, 2))
+        return np.concatenate([centers for _, centers in self._window])
 
 
 class Region:
     """Класс, представляющий географический регион."""
     def __init__(self, coordinates: list[tuple], 
                  r1: float = None, r2: float = None, r3: float = None, 
-                 percent1: int = 70, percent2: int = None, percent3: int = None):
+                 percent1: int = 70, percent2: int = None, percent3: int = None,
+                 approximate: bool = False, cache: bool = True, tiers: list[tuple] = None,
+                 seed: int = 0, sampler: str = "sunflower", instrument: bool = False,
+                 holes: list[list[tuple]] = None, parts: list[list[list[tuple]]] = None,
+                 coverage_resolution: int = None):
         """
-        Инициализирует регион. Если переданы r1, r2, r3, сразу производит расчет башен.
+        Инициализирует регион. Если переданы r1, r2, r3 (или tiers), сразу производит расчет башен.
+        holes: вырезы (озера, запретные зоны) внутри coordinates — список колец.
+        parts: дополнительные непересекающиеся части в виде [внешнее кольцо, вырез, ...],
+        как в GeoJSON MultiPolygon. Все кольца обрабатываются за один проход по общей решетке.
+        coverage_resolution: после каждого расчета считать показатели покрытия на растре
+        такого размера (см. analyze_coverage).
+        tiers: список (радиус, процент) для произвольного числа ярусов по убыванию радиуса;
+        процент None наследуется от предыдущего яруса.
+        approximate: использовать быструю приближенную оценку покрытия по набору точек.
+        cache: брать результат из дискового кэша, если такой расчет уже выполнялся.
+        seed, sampler: зерно и вид набора точек для приближенного режима (см. DiskSampler).
+        instrument: собирать счетчики и время ярусов в region.stats.
         """
         # Базовая валидация и геометрия
         if not coordinates or len(coordinates) < 3:
             raise ValueError("less than 3 coordinates provided")
         self.coordinates = coordinates
+        self.holes = list(holes) if holes else []
+        self.parts = [list(part) for part in parts] if parts else []
+        for ring in self.holes + [ring for part in self.parts for ring in part]:
+            if len(ring) < 3:
+                raise ValueError("less than 3 coordinates provided")
+        self.seed = seed
+        self.sampler = sampler
+        # Инструментирование: при None проверки в горячих участках сводятся к одному сравнению
+        self.stats = PlacementStats() if instrument else None
+        self.coverage_resolution = coverage_resolution
+        self.coverage = None
+        # Сдвиг сетки в долях периода по x и y (подбирается в optimize_tiers)
+        self.lattice_phase = (0.0, 0.0)
+        self.lattice = None
+        # Наборы точек единичного круга по числу точек; строятся один раз и переиспользуются
+        self._samplers = {}
         self.area = self.calculate_area()
         self.rectangle = self.calculate_rectangle()
+        self._edges = self._build_edges()
+        # Растр внутренних/внешних/граничных ячеек и полосы ребер для быстрой проверки точек
+        self._index = PolygonIndex(self._edges, self.rectangle)
         
         # Инициализация хранилища
-        self.centers_of_towers = {}
+        self.layout = TowerLayout.from_tiers([])
+        # Результаты по ярусам с параметрами, от которых они зависят (для инкрементального пересчета)
+        self._tiers = []
 
         # Логика автоматического запуска
-        if r1 is not None and r2 is not None and r3 is not None:
+        if tiers is not None:
+            self.find_centers_of_tiers(_resolve_percents(tiers, percent1), approximate=approximate, cache=cache)
+        elif r1 is not None and r2 is not None and r3 is not None:
             if percent2 is None:
                 percent2 = percent1
             if percent3 is None:
                 percent3 = percent2
-            self.find_all_centers_of_towers(r1, r2, r3, percent1, percent2, percent3)
+            self.find_all_centers_of_towers(r1, r2, r3, percent1, percent2, percent3,
+                                            approximate=approximate, cache=cache)
+    def get_rings(self) -> list[tuple]:
+        """Все кольца региона парами (кольцо, является ли вырезом); первым идет coordinates."""
+        rings = [(self.coordinates, False)] + [(hole, True) for hole in self.holes]
+        for outer, *part_holes in self.parts:
+            rings.append((outer, False))
+            rings.extend((hole, True) for hole in part_holes)
+        return rings
     def calculate_area(self):
-        """Вычисляет площадь многоугольника по формуле Гаусса."""
-        coords = self.coordinates
-        n = len(self.coordinates) 
+        """Вычисляет площадь региона по формуле Гаусса: внешние кольца минус вырезы."""
         area = 0.0
-        for i in range(n):
-            j = (i + 1) % n
-            area += coords[i][0] * coords[j][1]
-            area -= coords[j][0] * coords[i][1]
-        return abs(area) / 2.0
+        for ring, is_hole in self.get_rings():
+            ring_area = abs(_ring_area(ring))
+            area += -ring_area if is_hole else ring_area
+        return area
     def calculate_rectangle(self):
         """Вычисляет ограничивающий прямоугольник региона."""
-        cords=self.coordinates
+        # Вырезы лежат внутри своих внешних колец и на прямоугольник не влияют
+        cords = [point for ring, is_hole in self.get_rings() if not is_hole for point in ring]
         min_x = cords[0][0]
         max_x = cords[0][0]
         min_y = cords[0][1]
@@ -56,26 +218,47 @@ class Region:
             if y > max_y:
                 max_y = y
         return ((min_x, min_y), (max_x, max_y))
+    def _build_edges(self):
+        """
+        Готовит массивы рёбер (xi, yi, xj, yj) всех колец для векторной проверки принадлежности.
+        Правило чет-нечет само учитывает вырезы и несколько частей. Для точной площади
+        пересечения кольца ориентируются согласованно: внешние — как coordinates, вырезы — обратно.
+        """
+        rings = self.get_rings()
+        main_sign = _ring_area(self.coordinates) >= 0
+        arrays = []
+        for index, (ring, is_hole) in enumerate(rings):
+            coords = np.asarray(ring, dtype=np.float64)
+            if index > 0 and ((_ring_area(ring) >= 0) == main_sign) == is_hole:
+                coords = coords[::-1]
+            arrays.append((coords, np.roll(coords, 1, axis=0)))   # j = i - 1, как в скалярном обходе
+        coords = np.concatenate([c for c, _ in arrays])
+        prev = np.concatenate([p for _, p in arrays])
+        return coords[:, 0], coords[:, 1], prev[:, 0], prev[:, 1]
     def get_area(self):
         return self.area
     def get_bounding_rectangle(self):
         return self.rectangle
     def get_coordinates(self):
         return self.coordinates
+    @property
+    def centers_of_towers(self) -> TowerLayout:
+        """Центры по ярусам {'r1_centers': массив (N, 2), ...} — представления внутри self.layout."""
+        return self.layout
     def get_centers_of_towers(self):
-        return self.centers_of_towers
+        return self.layout
     def get_number_of_towers(self):
-        return {k: len(v) for k, v in self.centers_of_towers.items()}
+        return self.layout.counts()
     def get_total_number_of_towers(self):
-        return sum(len(v) for v in self.centers_of_towers.values())
+        return self.layout.total()
     def __str__(self):
         # 1. Получаем данные
         total_towers = self.get_total_number_of_towers()
         towers_breakdown = self.get_number_of_towers()
         
         details_list = []
-        # Сортируем ключи, чтобы R1 всегда был перед R2
-        for key in sorted(towers_breakdown.keys()):
+        # Ярусы хранятся по порядку: R1, R2, ... (сортировка строк поставила бы R10 перед R2)
+        for key in towers_breakdown:
             count = towers_breakdown[key]
             clean_name = key.replace('_centers', '').upper()
             details_list.append(f"  • {clean_name}: {count} шт.")
@@ -85,108 +268,297 @@ class Region:
         # 3. Форматируем площадь (2 знака после запятой)
         area_str = f"{self.area:,.2f}".replace(",", " ")
 
+        rings_str = ""
+        if self.holes or self.parts:
+            rings_str = (f"  • Частей:  {1 + len(self.parts)}\n"
+                         f"  • Вырезов: {len(self.holes) + sum(len(p) - 1 for p in self.parts)}\n")
+
+        coverage_str = ""
+        if self.coverage is not None:
+            coverage_str = (
+                f"----------------------------------------\n"
+                f"Покрытие:\n"
+                f"{self.coverage}\n"
+            )
+
+        stats_str = ""
+        if self.stats is not None:
+            stats_str = (
+                f"----------------------------------------\n"
+                f"Профилирование:\n"
+                f"{self.stats}\n"
+            )
+
         return (
             f"========================================\n"
             f"📍 ОТЧЕТ О РЕГИОНЕ\n"
             f"========================================\n"
             f"Геометрия:\n"
-            f"  • Вершин:  {len(self.coordinates)}\n"
+            f"  • Вершин:  {len(self._edges[0])}\n"
+            f"{rings_str}"
             f"  • Площадь: {area_str} кв. км.\n"
             f"----------------------------------------\n"
             f"Инфраструктура:\n"
             f"  • Всего вышек: {total_towers}\n"
             f"  • Детализация:\n"
             f"{details_str}\n"
+            f"{coverage_str}"
+            f"{stats_str}"
             f"========================================"
         )
     def contains(self, point:tuple):
         """Проверяет, находится ли точка внутри региона."""
-        x, y = point
+        return bool(self.contains_many(np.array([point], dtype=np.float64))[0])
+    def contains_many(self, points: np.ndarray, chunk_size: int = 1 << 20) -> np.ndarray:
+        """
+        Проверяет принадлежность региону сразу для N точек (правило чет-нечет).
+        points: массив формы (N, 2). Возвращает булев массив формы (N,).
+        chunk_size: ограничение на число пар точка-ребро в одном блоке вычислений.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if self.stats is not None:
+            self.stats.add('contains_calls', len(points))
+        x = points[:, 0]
+        y = points[:, 1]
         (min_x, min_y), (max_x, max_y) = self.rectangle
-        if not (min_x <= x <= max_x and min_y <= y <= max_y):
-            return False
-        inside = False
-        n = len(self.coordinates)
-        j = n - 1
-        for i in range(n):
-            xi, yi = self.coordinates[i]
-            xj, yj = self.coordinates[j]
-            
-            intersect = ((yi > y) != (yj > y)) and \
-                        (x < (xj - xi) * (y - yi) / (yj - yi) + xi)
-            if intersect:
-                inside = not inside
-            j = i
-            
-        return inside
-    def _check_circle_overlap(self, center: tuple, r: float, threshold_percent: int, samples: int = 25) -> bool:
+        result = (min_x <= x) & (x <= max_x) & (min_y <= y) & (y <= max_y)
+        candidates = np.flatnonzero(result)
+        if candidates.size == 0:
+            return result
+        # Точки во внутренних/внешних ячейках растра решаются сразу,
+        # в граничных — по ребрам своей полосы (см. PolygonIndex)
+        result[candidates] = self._index.contains(x[candidates], y[candidates], chunk_size)
+        return result
+    def _check_circle_overlap(self, center: tuple, r: float, threshold_percent: int, samples: int = 25,
+                              approximate: bool = False) -> bool:
         """
         Проверяет, находится ли заданный процент площади окружности внутри региона.
-        Использует метод Монте-Карло.
+        По умолчанию площадь пересечения считается точно (аналитически),
+        при approximate=True — по samples точкам фиксированного набора (см. DiskSampler).
         """
-        cx, cy = center
-        
-        # ОПТИМИЗАЦИЯ 1: Если центр внутри, и процент нужен небольшой (<40%) 
-        center_inside = self.contains(center)
-        if center_inside and threshold_percent < 40:
-             return True
-        
+        centers = np.array([center], dtype=np.float64)
+        return bool(self._coverage_mask(centers, r, threshold_percent, samples, approximate)[0])
+
+    def _coverage_mask(self, centers: np.ndarray, r: float, threshold_percent: int,
+                       samples: int = 25, approximate: bool = False) -> np.ndarray:
+        """
+        Векторный вариант _check_circle_overlap для массива центров формы (N, 2).
+        Возвращает булеву маску принятых центров.
+        """
+        center_inside = self.contains_many(centers)
+        accept = np.zeros(len(centers), dtype=bool)
+
+        # ОПТИМИЗАЦИЯ 1: Если центр внутри, и процент нужен небольшой (<40%)
+        if threshold_percent < 40:
+            accept |= center_inside
+            undecided = ~center_inside
+            if self.stats is not None:
+                self.stats.add('shortcut_inside', np.count_nonzero(center_inside))
         # ОПТИМИЗАЦИЯ 2: Если центр снаружи, а нужен высокий процент (>60%)
-        if not center_inside and threshold_percent > 60:
-            return False
+        elif threshold_percent > 60:
+            undecided = center_inside
+            if self.stats is not None:
+                self.stats.add('shortcut_outside', np.count_nonzero(~center_inside))
+        else:
+            undecided = np.ones(len(centers), dtype=bool)
 
-        inside_count = 0
-        
-        # Генерируем точки и проверяем их
-        for _ in range(samples):
-            # Генерация случайной точки внутри круга (равномерное распределение)
-            angle = random.random() * 2 * math.pi
-            dist = r * math.sqrt(random.random())
-            
-            px = cx + dist * math.cos(angle)
-            py = cy + dist * math.sin(angle)
-            
-            if self.contains((px, py)):
-                inside_count += 1
-        
-        calculated_percent = (inside_count / samples) * 100
-        return calculated_percent >= threshold_percent
+        # ОПТИМИЗАЦИЯ 3: окружность целиком во внутренних или внешних ячейках растра
+        idx = np.flatnonzero(undecided)
+        cx = centers[idx, 0]
+        cy = centers[idx, 1]
+        box = self._index.box_state(cx - r, cy - r, cx + r, cy + r)
+        if threshold_percent < 100:
+            accept[idx[box == INSIDE]] = True
+        if threshold_percent <= 0:
+            accept[idx[box == OUTSIDE]] = True
+        idx = idx[(box != INSIDE) & (box != OUTSIDE)]
+
+        if idx.size == 0:
+            return accept
+        if self.stats is not None:
+            self.stats.add('coverage_evaluations', idx.size)
+        if approximate:
+            calculated_percent = self._sampled_percent(centers[idx], r, samples)
+        else:
+            inside_area = circle_polygon_area(centers[idx], r, self._edges)
+            calculated_percent = inside_area / (math.pi * r * r) * 100
+        accept[idx] = calculated_percent >= threshold_percent
+        return accept
+
+    def _disk_sampler(self, samples: int) -> DiskSampler:
+        sampler = self._samplers.get(samples)
+        if sampler is None:
+            sampler = self._samplers[samples] = DiskSampler(samples, self.seed, self.sampler)
+        return sampler
 
-    def pack_circles_hexagonal(self, r: int, percent: int, accuracy: int = 30):
+    def _sampled_percent(self, centers: np.ndarray, r: float, samples: int) -> np.ndarray:
         """
-        Упаковывает окружности внутри региона в гексагональной сетке.
+        Оценивает процент площади окружностей внутри региона по фиксированному
+        набору точек единичного круга (seed и вид набора задаются в регионе).
         """
-        (min_x, min_y), (max_x, max_y) = self.rectangle
-        circles = []
-        
-        if 2 * r > (max_x - min_x) or 2 * r > (max_y - min_y):
-            return circles
+        inside = self.contains_many(self._disk_sampler(samples).place(centers, r))
+        inside_count = np.count_nonzero(inside.reshape(len(centers), samples), axis=1)
+        return inside_count / samples * 100
 
+    def _lattice_rows(self, r: float):
+        """
+        Координаты строк гексагональной сетки: y строк и x для четных и нечетных строк.
+        """
+        (min_x, min_y), (max_x, max_y) = self.rectangle
         dx = 2 * r
         dy_offset = math.sqrt(3) * r
-        
-        # Исправление 1: Добавляем epsilon для корректной обработки границ
+        # Добавляем epsilon для корректной обработки границ
         epsilon = 1e-9
 
-        y = min_y + r
-        row_index = 0
+        # Сдвиг начала сетки наружу; при (0, 0) сетка начинается с min + r
+        shift_x = self.lattice_phase[0] * dx
+        shift_y = self.lattice_phase[1] * dy_offset
 
-        while y <= max_y - r + epsilon:
-            if row_index % 2 == 0:
-                x_start = min_x + r
-            else:
-                x_start = min_x + r + r
+        ys = _accumulate(min_y + r - shift_y, dy_offset, max_y - r + epsilon)
+        even_xs = _accumulate(min_x + r - shift_x, dx, max_x - r + epsilon)
+        odd_xs = _accumulate(min_x + r + r - shift_x, dx, max_x - r + epsilon)
+        return ys, even_xs, odd_xs
 
-            x = x_start
-            while x <= max_x - r + epsilon:
-                if self._check_circle_overlap((x, y), r, percent, accuracy):
-                    circles.append((x, y))
-                x += dx
-            
-            y += dy_offset
-            row_index += 1
+    def _hex_lattice(self, r: float, row_start: int = 0, row_stop: int = None) -> np.ndarray:
+        """
+        Строит гексагональную сетку кандидатов (строки row_start..row_stop) внутри
+        ограничивающего прямоугольника.
+        Возвращает массив формы (N, 2) в порядке обхода: строка за строкой, слева направо.
+        """
+        ys, even_xs, odd_xs = self._lattice_rows(r)
+        row_indexes = range(len(ys))[row_start:row_stop]
+
+        rows = [odd_xs if row_index % 2 else even_xs for row_index in row_indexes]
+        if not rows:
+            return np.empty((0, 2))
+        xs = np.concatenate(rows)
+        return np.column_stack((xs, np.repeat(ys[row_start:row_stop], [len(row) for row in rows])))
 
-        return circles
+    def _prepare_obstacles(self, obstacle_groups: list[tuple], r_new: float):
+        """
+        Объединяет все предыдущие ярусы в один набор препятствий:
+        (массив центров, массив радиусов, сеточный индекс) или None, если препятствий нет.
+        Индекс один на все ярусы; внутри него препятствия разбиты по радиусу, и кандидат
+        просматривает ячейки размером r_group + r_new — только тех соседей, что могут его задеть.
+        Порядок точек — по ярусам, внутри яруса — исходный.
+        """
+        groups = [(np.asarray(coords, dtype=np.float64).reshape(-1, 2), r_group)
+                  for coords, r_group in obstacle_groups]
+        groups = [(coords, r_group) for coords, r_group in groups if len(coords)]
+        if not groups:
+            return None
+        points = np.concatenate([coords for coords, _ in groups])
+        radii = np.concatenate([np.full(len(coords), r_group, dtype=np.float64) for coords, r_group in groups])
+        index = GridIndex(points, radii + r_new)
+        return points, radii, index
+
+    def _evaluate_lattice(self, r_new: float, percent: int, obstacles,
+                          accuracy: int, approximate: bool,
+                          row_start: int = 0, row_stop: int = None,
+                          chunk_size: int = 1 << 20) -> np.ndarray:
+        """
+        Проверяет строки row_start..row_stop сетки радиуса r_new и возвращает принятые центры.
+        obstacles: результат _prepare_obstacles для предыдущих ярусов.
+        chunk_size: ограничение на число пар кандидат-препятствие в одном блоке строк сетки.
+        """
+        # 1. Считаем максимально допустимую площадь перекрытия
+        # Если percent=80 (хотим 80% чистого), то overlap может быть до 20%
+        circle_area = math.pi * (r_new ** 2)
+        max_allowed_overlap = circle_area * ((100 - percent) / 100.0)
+
+        # Строки проверяются блоками, чтобы пары кандидат-препятствие и временные массивы
+        # проверки границ не росли с размером сетки. Кандидаты не зависят друг от друга,
+        # а перекрытие кандидата считается внутри его блока в том же порядке,
+        # поэтому результат не зависит от chunk_size
+        ys, even_xs, odd_xs = self._lattice_rows(r_new)
+        row_start, row_stop, _ = slice(row_start, row_stop).indices(len(ys))
+        # Верхняя граница пар на кандидата; не меньше 16 — на временные массивы проверки границ
+        pairs = obstacles[2].max_pairs() if obstacles is not None else 0
+        rows_per_block = max(1, chunk_size // (max(16, pairs) * max(len(even_xs), len(odd_xs), 1)))
+
+        accepted = [np.empty((0, 2))]
+        for block_start in range(row_start, row_stop, rows_per_block):
+            lattice = self._hex_lattice(r_new, block_start, min(block_start + rows_per_block, row_stop))
+            is_valid = np.ones(len(lattice), dtype=bool)
+            if self.stats is not None:
+                self.stats.add('candidates', len(lattice))
+            if obstacles is not None:
+                is_valid = self._overlap_mask(lattice, r_new, max_allowed_overlap, *obstacles)
+
+            # 4. Для прошедших по коллизиям проверяем границы региона
+            idx = np.flatnonzero(is_valid)
+            is_valid[idx] = self._coverage_mask(lattice[idx], r_new, percent, accuracy, approximate)
+            accepted.append(lattice[is_valid])
+        return np.concatenate(accepted)
+
+    def _overlap_mask(self, lattice: np.ndarray, r_new: float, max_allowed_overlap: float,
+                      points: np.ndarray, radii: np.ndarray, index) -> np.ndarray:
+        """Маска кандидатов, чье суммарное перекрытие с препятствиями не превышает допустимого."""
+        # 2. Собираем все пары (кандидат, препятствие), у которых круги пересекаются
+        cand, obst = index.query_pairs(lattice)
+        ex = points[obst, 0]
+        ey = points[obst, 1]
+        cx = lattice[cand, 0]
+        cy = lattice[cand, 1]
+        r_group = radii[obst]
+        safe_dist = r_group + r_new # Дистанция полного касания
+        # Дистанция, при которой круги хотя бы касаются
+        min_dist_sq = safe_dist ** 2 * 0.999
+
+        # Быстрые проверки по осям, затем точное расстояние
+        near = (np.abs(ey - cy) <= safe_dist) & (np.abs(ex - cx) <= safe_dist)
+        d_sq = (ex - cx) ** 2 + (ey - cy) ** 2
+        hit = near & (d_sq < min_dist_sq)
+        overlap_area = circle_intersection_area(r_new, r_group[hit], np.sqrt(d_sq[hit]))
+        if self.stats is not None:
+            self.stats.add('axis_rejects', np.count_nonzero(~near))
+            self.stats.add('intersection_area_calls', overlap_area.size)
+
+        # 3. Накопленное перекрытие по каждому кандидату (в порядке ярусов и препятствий)
+        current_overlap = np.bincount(cand[hit], weights=overlap_area, minlength=len(lattice))
+        return current_overlap <= max_allowed_overlap
+
+    def _pack(self, r_new: float, percent: int, obstacle_groups: list[tuple],
+              accuracy: int, approximate: bool, workers: int = 1) -> np.ndarray:
+        """
+        Размещает ярус радиуса r_new с учетом препятствий.
+        При workers > 1 строки сетки делятся на горизонтальные полосы и проверяются
+        в пуле процессов. Кандидаты одного яруса не зависят друг от друга,
+        поэтому результат совпадает с последовательным расчетом.
+        """
+        obstacles = self._prepare_obstacles(obstacle_groups, r_new)
+        row_count = len(self._lattice_rows(r_new)[0])
+        if workers <= 1 or row_count < 2:
+            return self._evaluate_lattice(r_new, percent, obstacles, accuracy, approximate)
+
+        # Полос больше, чем процессов, чтобы выровнять нагрузку
+        bands = np.array_split(np.arange(row_count), min(row_count, workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self, obstacles)) as pool:
+            futures = [pool.submit(_evaluate_band, r_new, percent, accuracy, approximate,
+                                   int(band[0]), int(band[-1]) + 1)
+                       for band in bands]
+            parts = [future.result() for future in futures]
+        if self.stats is not None:
+            for _, counters in parts:
+                self.stats.merge(counters)
+        return np.concatenate([centers for centers, _ in parts])
+
+    def pack_circles_hexagonal(self, r: int, percent: int, accuracy: int = 30, approximate: bool = False,
+                               as_array: bool = False, workers: int = 1):
+        """
+        Упаковывает окружности внутри региона в гексагональной сетке.
+        accuracy: число случайных точек, используется только при approximate=True.
+        as_array: вернуть центры массивом формы (N, 2) вместо списка кортежей.
+        workers: число процессов для расчета.
+        """
+        (min_x, min_y), (max_x, max_y) = self.rectangle
+        circles = np.empty((0, 2))
+
+        if not (2 * r > (max_x - min_x) or 2 * r > (max_y - min_y)):
+            circles = self._pack(r, percent, [], accuracy, approximate, workers)
+
+        return circles if as_array else _as_tuples(circles)
 
     def _calculate_intersection_area(self, r1: float, r2: float, d: float) -> float:
         """
@@ -194,6 +566,8 @@ class Region:
         r1, r2: радиусы окружностей.
         d: расстояние между центрами.
         """
+        if self.stats is not None:
+            self.stats.add('intersection_area_calls')
         # 1. Если окружности не пересекаются
         if d >= r1 + r2:
             return 0.0
@@ -226,210 +600,308 @@ class Region:
                                r_existing: float, 
                                existing_circles_2: list[tuple] = None, 
                                r_existing_2: float = None,
-                               accuracy: int = 20):
+                               accuracy: int = 20,
+                               approximate: bool = False,
+                               as_array: bool = False,
+                               workers: int = 1,
+                               extra_obstacles: list[tuple] = None):
         """
         Размещает новые окружности (r_new).
         Условие коллизии: 'Чистая площадь' новой окружности должна быть >= percent.
         То есть площадь пересечений не должна превышать (100 - percent).
+        accuracy: число случайных точек, используется только при approximate=True.
+        as_array: вернуть центры массивом формы (N, 2) вместо списка кортежей.
+        workers: число процессов для расчета.
+        extra_obstacles: дополнительные группы препятствий [(центры, радиус), ...].
         """
-        new_circles = []
-        
         obstacle_groups = []
-        if existing_circles:
+        if existing_circles is not None and len(existing_circles):
             obstacle_groups.append((existing_circles, r_existing))
-        if existing_circles_2 and r_existing_2 is not None:
+        if existing_circles_2 is not None and len(existing_circles_2) and r_existing_2 is not None:
             obstacle_groups.append((existing_circles_2, r_existing_2))
+        obstacle_groups.extend(extra_obstacles or [])
 
-        # 1. Считаем максимально допустимую площадь перекрытия
-        # Если percent=80 (хотим 80% чистого), то overlap может быть до 20%
-        circle_area = math.pi * (r_new ** 2)
-        max_allowed_overlap = circle_area * ((100 - percent) / 100.0)
-
-        # Предварительный расчет квадратов для быстрого отсева
-        group_min_dists_sq = []
-        for _, r_group in obstacle_groups:
-            # Дистанция, при которой круги хотя бы касаются
-            dist = (r_group + r_new) ** 2 * 0.999
-            group_min_dists_sq.append(dist)
-
-        (min_x, min_y), (max_x, max_y) = self.rectangle
-        dx = 2 * r_new
-        dy_offset = math.sqrt(3) * r_new
-        epsilon = 1e-9
-
-        y = min_y + r_new
-        row_index = 0
-        
-        while y <= max_y - r_new + epsilon:
-            if row_index % 2 == 0:
-                x_start = min_x + r_new
-            else:
-                x_start = min_x + r_new + r_new
-                
-            x = x_start
-            while x <= max_x - r_new + epsilon:
-                candidate = (x, y)
-                
-                # Накопитель перекрытия для текущего кандидата
-                current_overlap = 0.0
-                is_valid = True
-                
-                for i, (group_coords, r_group) in enumerate(obstacle_groups):
-                    min_dist_sq = group_min_dists_sq[i]
-                    safe_dist = r_group + r_new # Дистанция полного касания
-                    
-                    for ex, ey in group_coords:
-                        # --- ОПТИМИЗАЦИИ ---
-                        # 1. Если препятствие слишком высоко по Y (список отсортирован), выходим
-                        if ey > y + safe_dist:
-                             break 
-                        # 2. Быстрые проверки по осям
-                        if abs(ey - y) > safe_dist:
-                            continue
-                        if abs(ex - x) > safe_dist:
-                            continue
-                        
-                        d_sq = (ex - x)**2 + (ey - y)**2
-                        
-                        # --- ПРОВЕРКА КОЛЛИЗИИ ---
-                        # Если расстояние меньше суммы радиусов -> есть пересечение
-                        if d_sq < min_dist_sq:
-                            # Считаем точную площадь пересечения
-                            dist = math.sqrt(d_sq)
-                            overlap_area = self._calculate_intersection_area(r_new, r_group, dist)
-                            current_overlap += overlap_area
-                            
-                            # Если накопленное пересечение уже больше допустимого -> окружность не подходит
-                            if current_overlap > max_allowed_overlap:
-                                is_valid = False
-                                break 
-                    
-                    if not is_valid:
-                        break # Выход из цикла по группам
-
-                # Если по коллизиям с соседями прошли, проверяем границы региона
-                if is_valid:
-                    # accuracy здесь отвечает за проверку "внутри многоугольника"
-                    if self._check_circle_overlap(candidate, r_new, percent, accuracy):
-                        new_circles.append(candidate)
-                
-                x += dx
-            
-            y += dy_offset
-            row_index += 1
-            
-        return new_circles
+        new_circles = self._pack(r_new, percent, obstacle_groups, accuracy, approximate, workers)
+        return new_circles if as_array else _as_tuples(new_circles)
 
     def find_all_centers_of_towers(self, r1: float, r2: float, r3: float, 
-                                   percent1: int = 60, percent2: int = 60, percent3: int = 60) -> dict:
+                                   percent1: int = 60, percent2: int = 60, percent3: int = 60,
+                                   approximate: bool = False, workers: int = 1, cache: bool = True) -> TowerLayout:
         """
         Находит центры башен.
         r1 - самый большой радиус, r2 - средний, r3 - самый маленький.
+        Обертка над find_centers_of_tiers для трех ярусов.
+        """
+        return self.find_centers_of_tiers([(r1, percent1), (r2, percent2), (r3, percent3)],
+                                          approximate=approximate, workers=workers, cache=cache)
+
+    def find_centers_of_tiers(self, tiers: list[tuple], approximate: bool = False,
+                              workers: int = 1, cache: bool = True) -> TowerLayout:
         """
+        Находит центры башен для произвольного числа ярусов.
+        tiers: список (радиус, процент) по убыванию радиуса. Первый ярус укладывается
+        в гексагональную сетку, каждый следующий — с учетом всех предыдущих.
+        approximate: оценивать покрытие по набору точек вместо точного расчета.
+        workers: число процессов; строки сетки каждого яруса делятся на полосы.
+        cache: использовать дисковый кэш результатов. Оба режима детерминированы;
+        для приближенного в ключ входят вид набора точек, seed и число точек.
+        Возвращает TowerLayout — словарь только для чтения {'r1_centers': массив (N, 2), ...}.
+        """
+        tiers = [(r, percent) for r, percent in tiers]
         # Валидация входных данных
-        if r1 <= 0 or r2 <= 0 or r3 <= 0:
-            raise ValueError("Radii must be positive values.")
-        if r1 < r2 or r2 < r3:
-            raise ValueError("R1 must be greater than R2, and R2 must be greater than R3.")
-        
-        # 1. Упаковка самых БОЛЬШИХ (r1). Результат в circles_r1
-        circles_r1 = self.pack_circles_hexagonal(r1, percent1, accuracy=50)
-        
-        # 2. Упаковка СРЕДНИХ (r2). Избегаем circles_r1. Результат в circles_r2
-        circles_r2 = self.pack_secondary_circles(
-            r_new=r2, 
-            percent=percent2, 
-            existing_circles=circles_r1, 
-            r_existing=r1, 
-            accuracy=30
-        )
-        
-        # 3. Упаковка МАЛЕНЬКИХ (r3). Избегаем r1 и r2. Результат в circles_r3
-        circles_r3 = self.pack_secondary_circles(
-            r_new=r3, 
-            percent=percent3, 
-            existing_circles=circles_r1, 
-            r_existing=r1, 
-            existing_circles_2=circles_r2, 
-            r_existing_2=r2, 
-            accuracy=20
-        )
-        self.centers_of_towers = {
-            'r1_centers': circles_r1,
-            'r2_centers': circles_r2,
-            'r3_centers': circles_r3
-        }
-        return {
-            'r1_centers': circles_r1,
-            'r2_centers': circles_r2,
-            'r3_centers': circles_r3
-        }
-    
-def visualize_towers(region: Region, r1: float, r2: float, r3: float):
-    """
-    Визуализирует регион и размещенные башни.
-    
-    Args:
-        region: Экземпляр класса Region.
-        r1, r2, r3: Радиусы для отрисовки (должны совпадать с расчетными).
-        results: (Опционально) Словарь с центрами. Если не передан, берется из region.
-    """
-    results = region.get_centers_of_towers()
-        
-    if not results:
-        print("Нет данных для визуализации (results пуст).")
-        return
-
-    fig, ax = plt.subplots(figsize=(10, 10))
-    
-    # 1. Отрисовка границ региона
-    poly_patch = Polygon(region.coordinates, 
-                         closed=True, 
-                         fill=False, 
-                         edgecolor='black', 
-                         linewidth=2, 
-                         label='Граница региона')
-    ax.add_patch(poly_patch)
-    
-    # Автоматическое масштабирование осей
-    (min_x, min_y), (max_x, max_y) = region.rectangle
-    # Добавляем самый большой радиус к границам графика, чтобы круги не обрезались
-    margin = r1 * 1.2
-    ax.set_xlim(min_x - margin, max_x + margin)
-    ax.set_ylim(min_y - margin, max_y + margin)
-    
-    # 2. Функция для отрисовки слоя
-    def plot_layer(centers, radius, color, label_prefix):
-        if not centers:
+        _validate_radii([r for r, _ in tiers])
+        names = [_tier_name(i) for i in range(len(tiers))]
+        tier_params = [(r, percent, approximate) for r, percent in tiers]
+
+        lattice = self._lattice_key()
+        mode = self._sampling_mode(len(tiers)) if approximate else "exact"
+        if lattice != (0.0, 0.0, 0.0):
+            mode += f":phase:{lattice[0]}:{lattice[1]}"
+
+        def compute():
+            # Ярус зависит от своих параметров и от всех предыдущих ярусов:
+            # пересчитываем начиная с первого изменившегося
+            reused = self._reusable_tiers(tier_params)
+            circles = []
+            for i in range(len(tiers)):
+                if i < reused:
+                    circles.append(self._tiers[i]['centers'])
+                    continue
+                timer = self.stats.timer(names[i]) if self.stats is not None else nullcontext()
+                with timer:
+                    circles.append(self._pack_tier(i, tiers, circles, approximate, workers))
+            return dict(zip(names, circles))
+
+        result = self._cached_placement(cache, mode, tiers, compute)
+        return self._store_tiers(tier_params, [result[name] for name in names], lattice)
+
+    def _lattice_key(self) -> tuple:
+        """Вариант сетки (fx, fy, угол) обычного расчета: сдвиг lattice_phase без поворота."""
+        return float(self.lattice_phase[0]), float(self.lattice_phase[1]), 0.0
+
+    def _sampling_mode(self, tier_count: int) -> str:
+        """Часть ключа кэша для приближенного режима: набор точек и их число по ярусам."""
+        accuracies = [_tier_accuracy(i) for i in range(tier_count)]
+        return f"sampled:{self.sampler}:{self.seed}:{accuracies}"
+
+    def _cache_key(self, mode: str, radii: list, percents: list) -> str:
+        """Ключ кэша размещений по кольцам региона, параметрам ярусов и режиму расчета."""
+        rings = [ring for ring, _ in self.get_rings()]
+        ring_sizes = [len(ring) for ring in rings] if len(rings) > 1 else None
+        return get_default_cache().make_key(
+            np.concatenate([np.asarray(ring, dtype=np.float64) for ring in rings]),
+            radii, percents, ALGORITHM_VERSION, mode, ring_sizes)
+
+    def _cached_placement(self, cache: bool, mode: str, tiers: list[tuple], compute,
+                          extra: tuple = ()) -> dict:
+        """
+        Массивы центров по ярусам {'r1_centers': ..., ...} (и ключи extra) из дискового кэша,
+        а если их там нет — результат compute(), который сохраняется в кэш.
+        """
+        if not cache:
+            return compute()
+        names = [_tier_name(i) for i in range(len(tiers))]
+        store = get_default_cache()
+        cache_key = self._cache_key(mode, [r for r, _ in tiers], [percent for _, percent in tiers])
+        cached = store.get(cache_key)
+        if cached is not None and set(cached) == set(names) | set(extra):
+            return cached
+        result = compute()
+        store.put(cache_key, result)
+        return result
+
+    def _store_tiers(self, tier_params: list[tuple], circles: list[np.ndarray],
+                     lattice: tuple) -> TowerLayout:
+        """Запоминает результат расчета ярусов в self.layout и возвращает его."""
+        self.layout = TowerLayout.from_tiers(circles)
+        # Ярусы хранят представления внутри layout, а не отдельные копии
+        self._tiers = [
+            {'radius': r, 'percent': percent, 'approximate': mode, 'centers': self.layout.tier(i),
+             'lattice': lattice}
+            for i, (r, percent, mode) in enumerate(tier_params)
+        ]
+        self.lattice = lattice
+        if self.coverage_resolution is not None:
+            self.analyze_coverage(self.coverage_resolution)
+        return self.layout
+
+    def optimize_tiers(self, tiers: list[tuple], offsets: int = 3, angles: int = 6,
+                       approximate: bool = False, workers: int = 1, cache: bool = True) -> TowerLayout:
+        """
+        Как find_centers_of_tiers, но перебирает сдвиги (offsets x offsets долей периода)
+        и повороты сетки (angles углов в [0, 60) градусов) и оставляет вариант с наименьшим
+        общим числом вышек; каждая вышка по-прежнему проходит проверку процента.
+        Варианты считаются параллельно (workers) и отбрасываются, как только уже
+        размещенные ярусы дают не меньше вышек, чем лучший найденный вариант.
+        Выбранный вариант (fx, fy, угол) сохраняется в region.lattice.
+        """
+        tiers = [(r, percent) for r, percent in tiers]
+        _validate_radii([r for r, _ in tiers])
+        if offsets < 1 or angles < 1:
+            raise ValueError("offsets and angles must be at least 1.")
+        names = [_tier_name(i) for i in range(len(tiers))]
+
+        mode = f"optimized:{offsets}:{angles}"
+        if approximate:
+            mode += ":" + self._sampling_mode(len(tiers))
+
+        def compute():
+            lattice, circles = search_layout(self, tiers, approximate, offsets, angles, workers)
+            return {**dict(zip(names, circles)), 'lattice': np.array(lattice)}
+
+        result = self._cached_placement(cache, mode, tiers, compute, extra=('lattice',))
+        tier_params = [(r, percent, approximate) for r, percent in tiers]
+        return self._store_tiers(tier_params, [result[name] for name in names],
+                                 tuple(result['lattice'].tolist()))
+
+    def _place_on_lattice(self, tiers: list[tuple], lattice: tuple, approximate: bool,
+                          cache: bool) -> TowerLayout:
+        """Размещает все ярусы на заданном варианте сетки (fx, fy, угол) без перебора."""
+        _validate_radii([r for r, _ in tiers])
+        names = [_tier_name(i) for i in range(len(tiers))]
+        lattice = tuple(float(value) for value in lattice)
+
+        mode = f"lattice:{lattice[0]}:{lattice[1]}:{lattice[2]}"
+        if approximate:
+            mode += ":" + self._sampling_mode(len(tiers))
+
+        def compute():
+            return dict(zip(names, place_layout(self, tiers, approximate, lattice)))
+
+        result = self._cached_placement(cache, mode, tiers, compute)
+        tier_params = [(r, percent, approximate) for r, percent in tiers]
+        return self._store_tiers(tier_params, [result[name] for name in names], lattice)
+
+    def analyze_coverage(self, resolution: int = 512):
+        """
+        Считает показатели покрытия текущего размещения (процент покрытия и перекрытия,
+        непокрытую площадь, крупнейшую дыру) на растре resolution ячеек по длинной стороне.
+        Результат сохраняется в region.coverage и выводится в отчете.
+        """
+        self.coverage = coverage_metrics(self, resolution)
+        return self.coverage
+
+    def _pack_tier(self, tier_index: int, tiers: list[tuple], circles: list[np.ndarray],
+                   approximate: bool, workers: int) -> np.ndarray:
+        """Размещает ярус tier_index с учетом уже размещенных ярусов circles."""
+        r, percent = tiers[tier_index]
+        if tier_index == 0:
+            # Самые БОЛЬШИЕ укладываются в сетку без препятствий
+            return self.pack_circles_hexagonal(r, percent, accuracy=_tier_accuracy(0),
+                                               approximate=approximate, as_array=True, workers=workers)
+        # Каждый следующий ярус избегает всех предыдущих
+        obstacle_groups = [(centers, radius) for centers, (radius, _) in zip(circles, tiers)]
+        return self._pack(r, percent, obstacle_groups, _tier_accuracy(tier_index), approximate, workers)
+
+    def iter_centers(self, tier: int, r1: float, r2: float, r3: float,
+                     percent1: int = 60, percent2: int = 60, percent3: int = 60,
+                     approximate: bool = False):
+        """
+        Генератор центров яруса tier (1, 2 или 3) строка за строкой по мере обхода сетки.
+        Обертка над iter_tier_centers для трех ярусов.
+        """
+        return self.iter_tier_centers(tier, [(r1, percent1), (r2, percent2), (r3, percent3)],
+                                      approximate=approximate)
+
+    def iter_tier_centers(self, tier: int, tiers: list[tuple], approximate: bool = False):
+        """
+        Генератор центров яруса tier (нумерация с 1) строка за строкой по мере обхода сетки.
+        Предыдущие ярусы не сохраняются целиком: они тоже читаются потоком,
+        и в памяти держится только окно строк рядом с текущей.
+        """
+        tier_params = [(r, percent) for r, percent in tiers]
+        _validate_radii([r for r, _ in tier_params])
+        if not 1 <= tier <= len(tier_params):
+            raise ValueError(f"tier must be between 1 and {len(tier_params)}.")
+        return self._iter_points(self._stream_tiers(tier_params, approximate, tier)[-1])
+
+    def iter_all_centers(self, tiers: list[tuple], approximate: bool = False):
+        """
+        Генератор (ярус, x, y) для всех ярусов за один проход сетки: строки ярусов
+        выдаются вперемешку по возрастанию y, каждый ярус рассчитывается один раз.
+        """
+        tier_params = [(r, percent) for r, percent in tiers]
+        _validate_radii([r for r, _ in tier_params])
+        streams = [zip(itertools.repeat(tier), stream)
+                   for tier, stream in enumerate(self._stream_tiers(tier_params, approximate), start=1)]
+        # Строки упорядочиваются по (y, ярус): отставание потоков друг от друга ограничено окнами
+        for tier, (_, centers) in heapq.merge(*streams, key=lambda row: (row[1][0], row[0])):
+            for x, y in centers.tolist():
+                yield tier, x, y
+
+    @staticmethod
+    def _iter_points(rows):
+        for _, centers in rows:
+            for point in centers.tolist():
+                yield tuple(point)
+
+    def _stream_tiers(self, tier_params: list[tuple], approximate: bool, count: int = None) -> list:
+        """
+        Потоки строк первых count ярусов. Поток яруса нужен всем следующим ярусам
+        и вызывающему, поэтому делится через itertools.tee и считается один раз.
+        """
+        streams = []
+        for tier_index in range(len(tier_params) if count is None else count):
+            sources = []
+            for j in range(tier_index):
+                streams[j], source = itertools.tee(streams[j])
+                sources.append(source)
+            streams.append(self._stream_tier(tier_index, tier_params, approximate, sources))
+        return streams
+
+    def _stream_tier(self, tier_index: int, tier_params: list[tuple], approximate: bool, sources: list):
+        """Выдает пары (y строки, принятые центры строки) для яруса tier_index по потокам предыдущих ярусов."""
+        r_new, percent = tier_params[tier_index]
+        (min_x, min_y), (max_x, max_y) = self.rectangle
+        if tier_index == 0 and (2 * r_new > (max_x - min_x) or 2 * r_new > (max_y - min_y)):
             return
-        
-        # Добавляем в легенду только первую точку слоя
-        ax.plot([], [], color=color, marker='o', linestyle='None', 
-                alpha=0.5, markersize=10, 
-                label=f"{label_prefix} (R={radius}, N={len(centers)})")
-        
-        for cx, cy in centers:
-            circle = Circle((cx, cy), radius, color=color, alpha=0.4, linewidth=0)
-            ax.add_patch(circle)
-            # Точка в центре
-            ax.plot(cx, cy, '.', color='black', markersize=1, alpha=0.3)
-
-    # 3. Рисуем слои (от больших к маленьким)
-    if 'r1_centers' in results:
-        plot_layer(results['r1_centers'], r1, 'blue', 'Tower R1')
-        
-    if 'r2_centers' in results:
-        plot_layer(results['r2_centers'], r2, 'green', 'Tower R2')
-        
-    if 'r3_centers' in results:
-        plot_layer(results['r3_centers'], r3, 'red', 'Tower R3')
-
-    # 4. Настройки
-    ax.set_aspect('equal')
-    plt.grid(True, linestyle='--', alpha=0.3)
-    
-    total_towers = sum(len(v) for v in results.values())
-    plt.title(f"Размещение башен: Всего {total_towers} шт.")
-    plt.legend(loc='upper right')
-    
-    plt.show()
+
+        windows = [(_ObstacleWindow(rows), r_group) for rows, (r_group, _) in zip(sources, tier_params)]
+        ys = self._lattice_rows(r_new)[0]
+        for row_index, y in enumerate(ys.tolist()):
+            groups = [(window.advance(y, r_group + r_new), r_group) for window, r_group in windows]
+            obstacles = self._prepare_obstacles(groups, r_new)
+            yield y, self._evaluate_lattice(r_new, percent, obstacles, _tier_accuracy(tier_index),
+                                            approximate, row_index, row_index + 1)
+
+    def _reusable_tiers(self, tier_params: list[tuple]) -> int:
+        """Число первых ярусов, чьи параметры не изменились с прошлого расчета."""
+        reused = 0
+        for tier, (r, percent, approximate) in zip(self._tiers, tier_params):
+            if (tier['radius'], tier['percent'], tier['approximate']) != (r, percent, approximate):
+                break
+            # Ярусы другой сетки (optimize_tiers, прежний lattice_phase) не переиспользуются
+            if tier['lattice'] != self._lattice_key():
+                break
+            reused += 1
+        return reused
+
+    def update(self, workers: int = 1, cache: bool = True, **changes) -> TowerLayout:
+        """
+        Пересчитывает размещение, изменив только переданные параметры (r1, percent1, r2, ...).
+        Ярусы до первого изменившегося берутся из прошлого расчета:
+        например, update(r3=5, percent3=80) пересчитывает только ярус R3.
+        После optimize_tiers все ярусы пересчитываются на выбранной тогда сетке (region.lattice).
+        """
+        if not self._tiers:
+            raise ValueError("No previous placement to update, call find_all_centers_of_towers first.")
+        tiers = [[tier['radius'], tier['percent']] for tier in self._tiers]
+        for name, value in changes.items():
+            match = re.fullmatch(r'(r|percent)(\d+)', name)
+            if match is None or not 1 <= int(match.group(2)) <= len(tiers):
+                raise TypeError(f"Unexpected parameter: {name}")
+            if value is not None:
+                tiers[int(match.group(2)) - 1][0 if match.group(1) == 'r' else 1] = value
+        tiers = [tuple(tier) for tier in tiers]
+        approximate = self._tiers[0]['approximate']
+        if self.lattice != self._lattice_key():
+            return self._place_on_lattice(tiers, self.lattice, approximate, cache)
+        return self.find_centers_of_tiers(tiers, approximate=approximate, workers=workers, cache=cache)
+
+
+def __getattr__(name):
+    # Отрисовка вынесена в sub.render и импортирует matplotlib только по запросу
+    if name in ("visualize_towers", "TIER_COLORS"):
+        from . import render
+        return getattr(render, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
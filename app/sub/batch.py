@@ -0,0 +1,174 @@
+import math
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .base_region import Region, _resolve_percents, _tier_accuracy, _tier_name, _validate_radii
+from .sampling import DiskSampler
+
+# Состояние процесса пула: параметры расчета и наборы точек передаются один раз при запуске
+_batch_state = {}
+
+
+def tiers_from_towers(towers: list, percents: list[int]) -> list[tuple]:
+    """
+    Ярусы (радиус, процент) по выбранным вышкам каталога.
+    Радиус — из площади покрытия вышки; вышки упорядочиваются по убыванию площади.
+    Процент None наследуется от предыдущего яруса, как в Region(tiers=...).
+    """
+    towers = sorted(towers, key=lambda tower: tower.square, reverse=True)
+    return [(math.sqrt(tower.square / math.pi), percents[i] if i < len(percents) else None)
+            for i, tower in enumerate(towers)]
+
+
+def _geometry(item) -> dict:
+    """Аргументы геометрии Region: кольцо координат или словарь coordinates/holes/parts."""
+    if isinstance(item, dict):
+        return {key: item.get(key) for key in ("coordinates", "holes", "parts")}
+    return {"coordinates": item, "holes": None, "parts": None}
+
+
+def _batch_options(tiers, approximate, cache, seed, sampler, samplers) -> dict:
+    return {'tiers': tiers, 'approximate': approximate, 'cache': cache,
+            'seed': seed, 'sampler': sampler, 'samplers': samplers}
+
+
+def _init_batch_worker(*options):
+    _batch_state.update(_batch_options(*options))
+
+
+def _place_region(index: int, item, state: dict) -> dict:
+    """Считает один регион в процессе пула (или в текущем процессе при jobs=1)."""
+    if isinstance(item, dict) and "error" in item:
+        # Запись не разобрана при чтении входа (sub.inputs)
+        return {"index": index, "error": item["error"]}
+    try:
+        region = Region(**_geometry(item), seed=state['seed'], sampler=state['sampler'])
+        # Наборы точек единичного круга общие для всех регионов
+        region._samplers = state['samplers']
+        region.find_centers_of_tiers(state['tiers'], approximate=state['approximate'],
+                                     cache=state['cache'])
+    except ValueError as error:
+        return {"index": index, "error": str(error)}
+    centers = {_tier_name(i): tier['centers'] for i, tier in enumerate(region._tiers)}
+    return {"index": index, "area": region.area, "centers": centers,
+            "counts": {name: len(c) for name, c in centers.items()}}
+
+
+def _place_chunk(chunk: list[tuple], state: dict = None) -> list[dict]:
+    """Считает пачку регионов; state — параметры расчета, по умолчанию из инициализации процесса пула."""
+    state = _batch_state if state is None else state
+    return [_place_region(index, item, state) for index, item in chunk]
+
+
+class BatchResult:
+    """
+    Результат пакетного расчета: results — по одному словарю на регион в порядке входа
+    (index, area, centers — массивы (N, 2) по ярусам, counts; либо index и error).
+    """
+    def __init__(self, results: list[dict], tier_names: list[str], elapsed: float):
+        self.results = results
+        self.tier_names = tier_names
+        self.elapsed = elapsed
+
+    def summary(self) -> dict:
+        """Сводка по всем регионам: число регионов, ошибки, площадь и вышки по ярусам."""
+        done = [result for result in self.results if "error" not in result]
+        towers = {name: sum(result["counts"][name] for result in done) for name in self.tier_names}
+        return {
+            "regions": len(self.results),
+            "failed": len(self.results) - len(done),
+            "area": sum(result["area"] for result in done),
+            "towers": towers,
+            "total_towers": sum(towers.values()),
+            "elapsed": self.elapsed,
+        }
+
+    def __str__(self):
+        summary = self.summary()
+        details = "\n".join(f"  • {name.replace('_centers', '').upper()}: {count} шт."
+                            for name, count in summary["towers"].items())
+        area_str = f"{summary['area']:,.2f}".replace(",", " ")
+        return (
+            f"========================================\n"
+            f"📦 ПАКЕТНЫЙ РАСЧЕТ\n"
+            f"========================================\n"
+            f"  • Регионов: {summary['regions']} (с ошибкой: {summary['failed']})\n"
+            f"  • Площадь:  {area_str} кв. км.\n"
+            f"  • Всего вышек: {summary['total_towers']}\n"
+            f"{details}\n"
+            f"  • Время: {summary['elapsed']:.2f} с\n"
+            f"========================================"
+        )
+
+
+def _chunks(regions, size: int):
+    """Пачки [(индекс, регион), ...] по size штук из любого итерируемого источника."""
+    chunk = []
+    for item in enumerate(regions):
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_place_regions(regions, tiers: list[tuple], approximate: bool = False, jobs: int = 1,
+                       cache: bool = True, seed: int = 0, sampler: str = "sunflower",
+                       chunk_size: int = None):
+    """
+    Потоковый вариант place_regions: выдает результаты регионов по мере готовности
+    в порядке входа. regions может быть генератором (например, чтение файла):
+    при jobs > 1 вперед читается не больше jobs * 2 пачек.
+    chunk_size: регионов в одной задаче пула; по умолчанию для списка — так, чтобы
+    задач было в 4 раза больше процессов, для генератора — 1 (длина неизвестна,
+    а забегание вперед и так ограничено окном задач).
+    """
+    tiers = _resolve_percents(tiers)
+    _validate_radii([r for r, _ in tiers])
+    samplers = {}
+    if approximate:
+        for i in range(len(tiers)):
+            samples = _tier_accuracy(i)
+            samplers[samples] = DiskSampler(samples, seed, sampler)
+    initargs = (tiers, approximate, cache, seed, sampler, samplers)
+
+    if chunk_size is None:
+        # Пачки крупнее одного региона снижают накладные расходы на передачу задач
+        chunk_size = math.ceil(len(regions) / (max(jobs, 1) * 4)) if hasattr(regions, "__len__") else 1
+    chunks = _chunks(regions, max(1, chunk_size))
+    if jobs <= 1:
+        # Параметры передаются явно: одновременно может идти несколько генераторов
+        state = _batch_options(*initargs)
+        for chunk in chunks:
+            yield from _place_chunk(chunk, state)
+        return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker,
+                             initargs=initargs) as pool:
+        # Не больше jobs * 2 пачек в работе: вход читается по мере выдачи результатов
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_place_chunk, chunk))
+            if len(pending) >= jobs * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def place_regions(regions: list, tiers: list[tuple], approximate: bool = False, jobs: int = 1,
+                  cache: bool = True, seed: int = 0, sampler: str = "sunflower") -> BatchResult:
+    """
+    Размещает вышки сразу для множества регионов с одной конфигурацией ярусов.
+    regions: кольца координат или словари {"coordinates", "holes", "parts"} (см. Region).
+    tiers: список (радиус, процент) по убыванию радиуса, например из tiers_from_towers.
+    jobs: число процессов; регионы раздаются пачками, наборы точек для приближенного
+    режима строятся один раз и передаются процессам при запуске.
+    Некорректный регион не прерывает расчет: в его результате будет ключ error.
+    """
+    regions = list(regions)
+    start = time.perf_counter()
+    results = list(iter_place_regions(regions, tiers, approximate, jobs, cache, seed, sampler))
+    elapsed = time.perf_counter() - start
+
+    return BatchResult(results, [_tier_name(i) for i in range(len(tiers))], elapsed)
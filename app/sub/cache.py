@@ -0,0 +1,132 @@
+import hashlib
+import json
+import os
+import zipfile
+
+import numpy as np
+
+# Ограничение размера кэша по умолчанию (байт)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# Через сколько записей размер каталога пересчитывается заново
+# (в него пишут и другие процессы, оценка своего процесса их не видит)
+RESCAN_EVERY = 256
+# Очистка освобождает место с запасом, чтобы следующие записи не запускали ее снова
+EVICT_TO = 0.9
+
+
+class PlacementCache:
+    """
+    Кэш результатов размещения на диске.
+    Ключ — хэш координат региона, радиусов, процентов и версии алгоритма,
+    значение — файл .npz с массивами центров по ярусам.
+    При превышении max_bytes удаляются давно не использованные записи (LRU).
+    """
+    def __init__(self, directory: str = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        if directory is None:
+            directory = os.environ.get("CNBS_CACHE_DIR") or \
+                os.path.join(os.path.expanduser("~"), ".cache", "cnbs")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # Оценка размера каталога: без обхода каталога на каждой записи
+        self._size = None
+        self._writes = 0
+
+    @staticmethod
+    def make_key(coordinates, radii, percents, version: int, mode: str = "exact",
+                 ring_sizes: list[int] = None) -> str:
+        """
+        Строит ключ кэша по входным данным расчета.
+        ring_sizes: длины колец, если coordinates — склеенные кольца региона с вырезами/частями.
+        """
+        digest = hashlib.sha256()
+        digest.update(np.ascontiguousarray(coordinates, dtype=np.float64).tobytes())
+        params = {"radii": [float(r) for r in radii],
+                  "percents": [float(p) for p in percents],
+                  "version": version,
+                  "mode": mode}
+        if ring_sizes is not None:
+            params["rings"] = [int(n) for n in ring_sizes]
+        digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".npz")
+
+    def get(self, key: str):
+        """Возвращает словарь массивов центров или None, если записи нет."""
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                result = {name: data[name] for name in data.files}
+            # Отмечаем использование записи для LRU
+            os.utime(path)
+        except (OSError, ValueError, zipfile.BadZipFile):
+            return None
+        return result
+
+    def put(self, key: str, centers: dict) -> None:
+        """Сохраняет результат; ошибки записи не прерывают расчет."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "wb") as file:
+                np.savez_compressed(file, **centers)
+            size = os.path.getsize(tmp_path)
+            # Перезапись ключа заменяет старый файл, а не добавляет к размеру
+            if os.path.exists(path):
+                size -= os.path.getsize(path)
+            os.replace(tmp_path, path)
+            self._writes += 1
+            if self._size is None or self._writes % RESCAN_EVERY == 0:
+                self._size = self._scan_size()
+            else:
+                self._size += size
+            if self._size > self.max_bytes:
+                self._evict()
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _scan_size(self) -> int:
+        with os.scandir(self.directory) as it:
+            return sum(entry.stat().st_size for entry in it if entry.name.endswith(".npz"))
+
+    def _evict(self) -> None:
+        """Удаляет самые старые по времени использования записи, пока размер не станет ниже EVICT_TO лимита."""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".npz"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes * EVICT_TO:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._size = total
+
+    def clear(self) -> None:
+        """Удаляет все записи кэша."""
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".npz"):
+                os.remove(os.path.join(self.directory, name))
+        self._size = 0
+
+
+_default_cache = None
+
+
+def get_default_cache() -> PlacementCache:
+    """Кэш по умолчанию (каталог задается переменной окружения CNBS_CACHE_DIR)."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = PlacementCache()
+    return _default_cache
@@ -0,0 +1,147 @@
+import math
+
+import numpy as np
+
+from .polygon_index import _expand_ranges
+
+
+class CoverageMetrics:
+    """
+    Показатели качества покрытия, посчитанные по растру региона.
+    Точность определяется размером ячейки cell_size: ошибка площадей порядка
+    периметра (границы региона и окружностей), умноженного на cell_size.
+    """
+    def __init__(self, coverage_percent: float, overlap_percent: float, uncovered_area: float,
+                 largest_hole_area: float, cell_size: float, shape: tuple):
+        self.coverage_percent = float(coverage_percent)
+        self.overlap_percent = float(overlap_percent)
+        self.uncovered_area = float(uncovered_area)
+        self.largest_hole_area = float(largest_hole_area)
+        self.cell_size = float(cell_size)
+        self.shape = shape
+
+    def as_dict(self) -> dict:
+        return {'coverage_percent': self.coverage_percent, 'overlap_percent': self.overlap_percent,
+                'uncovered_area': self.uncovered_area, 'largest_hole_area': self.largest_hole_area,
+                'cell_size': self.cell_size, 'shape': self.shape}
+
+    def __str__(self):
+        return "\n".join([
+            f"  • Покрыто: {self.coverage_percent:.2f}%",
+            f"  • Перекрытие (2+ вышки): {self.overlap_percent:.2f}%",
+            f"  • Непокрытая площадь: {self.uncovered_area:,.2f} кв. км.".replace(",", " "),
+            f"  • Крупнейшая дыра: {self.largest_hole_area:,.2f} кв. км.".replace(",", " "),
+            f"  • Растр: {self.shape[1]}x{self.shape[0]}, ячейка {self.cell_size:.4g}",
+        ])
+
+
+def _stamp_disks(counts: np.ndarray, x0: float, y0: float, cell: float,
+                 centers: np.ndarray, r: float, chunk_size: int = 1 << 22) -> None:
+    """
+    Прибавляет 1 в ячейках, центры которых попадают в окружности радиуса r.
+    Для каждого центра проверяется квадрат k x k ячеек вокруг него, все центры
+    обрабатываются блоками одним векторным выражением.
+    """
+    ny, nx = counts.shape
+    k = int(math.floor(2 * r / cell)) + 2
+    offsets = np.arange(k)
+    step = max(1, chunk_size // (k * k))
+    flat = counts.reshape(-1)
+    for start in range(0, len(centers), step):
+        cx = centers[start:start + step, 0]
+        cy = centers[start:start + step, 1]
+        # Первая ячейка, центр которой может попасть в окружность
+        i0 = np.ceil((cx - r - x0) / cell - 0.5).astype(np.int64)
+        j0 = np.ceil((cy - r - y0) / cell - 0.5).astype(np.int64)
+        i = i0[:, None] + offsets                        # (M, k) столбцы
+        j = j0[:, None] + offsets                        # (M, k) строки
+        dx2 = (x0 + (i + 0.5) * cell - cx[:, None]) ** 2
+        dy2 = (y0 + (j + 0.5) * cell - cy[:, None]) ** 2
+        inside = (dy2[:, :, None] + dx2[:, None, :] <= r * r)
+        inside &= ((j >= 0) & (j < ny))[:, :, None] & ((i >= 0) & (i < nx))[:, None, :]
+        cells = (j[:, :, None] * nx + i[:, None, :])[inside]
+        flat += np.bincount(cells, minlength=flat.size).astype(flat.dtype)
+
+
+def _largest_component(mask: np.ndarray) -> int:
+    """
+    Число ячеек в крупнейшей 4-связной области mask.
+    Строки разбиваются на отрезки подряд идущих ячеек, отрезки соседних строк,
+    пересекающиеся по столбцам, объединяются (union-find с подвешиванием корней
+    и сжатием путей, все шаги векторные).
+    """
+    ny, nx = mask.shape
+    if not mask.any():
+        return 0
+    padded = np.zeros((ny, nx + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    _, stops = np.nonzero(edges == -1)
+    n = len(rows)
+
+    # Для отрезка строки y — отрезки строки y + 1 с start < stop и stop > start
+    width = nx + 1
+    start_keys = rows * width + starts
+    stop_keys = rows * width + stops
+    first = np.searchsorted(stop_keys, (rows + 1) * width + starts, side='right')
+    last = np.searchsorted(start_keys, (rows + 1) * width + stops, side='left')
+    counts = np.maximum(last - first, 0)
+    a = np.repeat(np.arange(n), counts)
+    b = _expand_ranges(first, counts)
+
+    parent = np.arange(n)
+    while True:
+        pa = parent[a]
+        pb = parent[b]
+        lo = np.minimum(pa, pb)
+        hi = np.maximum(pa, pb)
+        changed = lo != hi
+        if not changed.any():
+            break
+        # Подвешиваем больший корень к меньшему, затем сжимаем пути до корней
+        np.minimum.at(parent, hi[changed], lo[changed])
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+    sizes = np.bincount(parent, weights=stops - starts, minlength=n)
+    return int(sizes.max())
+
+
+def coverage_metrics(region, resolution: int = 512) -> CoverageMetrics:
+    """
+    Растеризует регион и окружности всех ярусов на сетку и считает показатели покрытия.
+    resolution: число ячеек по длинной стороне ограничивающего прямоугольника;
+    время и память растут как resolution^2, ошибка убывает как 1 / resolution.
+    """
+    (min_x, min_y), (max_x, max_y) = region.rectangle
+    cell = max(max_x - min_x, max_y - min_y) / resolution
+    nx = max(1, math.ceil((max_x - min_x) / cell))
+    ny = max(1, math.ceil((max_y - min_y) / cell))
+
+    xs = min_x + (np.arange(nx) + 0.5) * cell
+    ys = min_y + (np.arange(ny) + 0.5) * cell
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    inside = region.contains_many(np.column_stack((grid_x.ravel(), grid_y.ravel()))).reshape(ny, nx)
+
+    counts = np.zeros((ny, nx), dtype=np.int32)
+    for tier in region._tiers:
+        centers = np.asarray(tier['centers'], dtype=np.float64).reshape(-1, 2)
+        if len(centers):
+            _stamp_disks(counts, min_x, min_y, cell, centers, tier['radius'])
+
+    total = np.count_nonzero(inside)
+    if total == 0:
+        return CoverageMetrics(0.0, 0.0, 0.0, 0.0, cell, (ny, nx))
+    uncovered = inside & (counts == 0)
+    cell_area = cell * cell
+    return CoverageMetrics(
+        coverage_percent=100.0 * np.count_nonzero(inside & (counts > 0)) / total,
+        overlap_percent=100.0 * np.count_nonzero(inside & (counts > 1)) / total,
+        uncovered_area=np.count_nonzero(uncovered) * cell_area,
+        largest_hole_area=_largest_component(uncovered) * cell_area,
+        cell_size=cell,
+        shape=(ny, nx),
+    )
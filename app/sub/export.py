@@ -0,0 +1,89 @@
+import csv
+import json
+
+
+def write_centers(centers, destination, fmt: str = "csv", tier: int = None, header: bool = True) -> int:
+    """
+    Записывает центры вышек в CSV или NDJSON по одной строке, не накапливая их в памяти.
+    centers: итерируемый источник (x, y), например Region.iter_centers(...).
+    destination: путь к файлу или открытый текстовый файл.
+    tier: номер яруса, добавляется отдельной колонкой.
+    Возвращает число записанных центров.
+    """
+    if fmt not in ("csv", "ndjson"):
+        raise ValueError(f"Unsupported format: {fmt}")
+    if isinstance(destination, str):
+        with open(destination, "w", encoding="UTF-8", newline="") as file:
+            return write_centers(centers, file, fmt, tier, header)
+
+    if tier is None:
+        return _write_rows(centers, destination, fmt, ["x", "y"], header)
+    return _write_rows(((tier, x, y) for x, y in centers), destination, fmt, ["tier", "x", "y"], header)
+
+
+def _write_rows(rows, destination, fmt: str, columns: list[str], header: bool) -> int:
+    count = 0
+    if fmt == "csv":
+        writer = csv.writer(destination)
+        if header:
+            writer.writerow(columns)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    else:
+        for row in rows:
+            destination.write(json.dumps(dict(zip(columns, row))) + "\n")
+            count += 1
+    return count
+
+
+def export_tiers(region, destination, tiers: list[tuple], fmt: str = "csv",
+                 approximate: bool = False) -> int:
+    """
+    Потоково рассчитывает все ярусы tiers [(радиус, процент), ...] за один проход
+    и пишет их в один файл с колонкой tier. Строки разных ярусов идут вперемешку
+    в порядке обхода сетки. Возвращает общее число вышек.
+    """
+    if fmt not in ("csv", "ndjson"):
+        raise ValueError(f"Unsupported format: {fmt}")
+    if isinstance(destination, str):
+        with open(destination, "w", encoding="UTF-8", newline="") as file:
+            return export_tiers(region, file, tiers, fmt, approximate)
+    return _write_rows(region.iter_all_centers(tiers, approximate), destination, fmt, ["tier", "x", "y"], True)
+
+
+def export_towers(region, destination, r1: float, r2: float, r3: float,
+                  percent1: int = 60, percent2: int = 60, percent3: int = 60,
+                  fmt: str = "csv") -> int:
+    """Обертка над export_tiers для трех ярусов."""
+    return export_tiers(region, destination, [(r1, percent1), (r2, percent2), (r3, percent3)], fmt)
+
+
+def write_region_results(results, destination, fmt: str = "ndjson", header: bool = True) -> int:
+    """
+    Пишет результаты пакетного расчета по мере поступления.
+    results: пары (id региона, результат iter_place_regions).
+    NDJSON — одна строка на регион (id, area, counts, centers по ярусам или error);
+    CSV — одна строка на вышку (region_id, tier, x, y), регионы с ошибкой пропускаются.
+    Возвращает число записанных регионов.
+    """
+    if fmt not in ("csv", "ndjson"):
+        raise ValueError(f"Unsupported format: {fmt}")
+    writer = csv.writer(destination) if fmt == "csv" else None
+    if writer is not None and header:
+        writer.writerow(["region_id", "tier", "x", "y"])
+
+    count = 0
+    for region_id, result in results:
+        if fmt == "ndjson":
+            if "error" in result:
+                record = {"id": region_id, "error": result["error"]}
+            else:
+                record = {"id": region_id, "area": result["area"], "counts": result["counts"],
+                          "centers": {name: centers.tolist() for name, centers in result["centers"].items()}}
+            destination.write(json.dumps(record, ensure_ascii=False) + "\n")
+        elif "error" not in result:
+            for tier, centers in enumerate(result["centers"].values(), start=1):
+                writer.writerows([region_id, tier, x, y] for x, y in centers.tolist())
+        count += 1
+    return count
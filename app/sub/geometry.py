@@ -0,0 +1,86 @@
+import math
+import numpy as np
+
+
+def _sector_area(px, py, qx, qy, r: float):
+    """Ориентированная площадь кругового сектора между лучами OP и OQ."""
+    return 0.5 * r * r * np.arctan2(px * qy - py * qx, px * qx + py * qy)
+
+
+def _edge_contributions(ax, ay, bx, by, r: float):
+    """
+    Ориентированная площадь пересечения круга (центр в начале координат)
+    с треугольником (O, A, B) для каждого ребра AB.
+    Ребро делится точками пересечения с окружностью на части: внутри круга
+    вклад даёт треугольник, снаружи — сектор.
+    """
+    dx = bx - ax
+    dy = by - ay
+    a = dx * dx + dy * dy
+    b = ax * dx + ay * dy
+    c = ax * ax + ay * ay - r * r
+    disc = b * b - a * c
+
+    # Ребро пересекает окружность (вырожденные рёбра нулевой длины пропускаем)
+    hit = (disc > 0) & (a > 0)
+    sq = np.sqrt(np.where(hit, disc, 0.0))
+    safe_a = np.where(a > 0, a, 1.0)
+    t1 = np.where(hit, np.clip((-b - sq) / safe_a, 0.0, 1.0), 1.0)
+    t2 = np.where(hit, np.clip((-b + sq) / safe_a, 0.0, 1.0), 1.0)
+
+    p1x = ax + t1 * dx
+    p1y = ay + t1 * dy
+    p2x = ax + t2 * dx
+    p2y = ay + t2 * dy
+
+    return (_sector_area(ax, ay, p1x, p1y, r)
+            + 0.5 * (p1x * p2y - p1y * p2x)
+            + _sector_area(p2x, p2y, bx, by, r))
+
+
+def circle_polygon_area(centers, r: float, edges, chunk_size: int = 1 << 20) -> np.ndarray:
+    """
+    Точная площадь пересечения окружностей радиуса r с многоугольником.
+    centers: массив центров формы (M, 2).
+    edges: кортеж массивов (xi, yi, xj, yj) — рёбра многоугольника.
+    Возвращает массив площадей формы (M,).
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    xi, yi, xj, yj = edges
+    areas = np.empty(len(centers), dtype=np.float64)
+    step = max(1, chunk_size // len(xi))
+    for start in range(0, len(centers), step):
+        cx = centers[start:start + step, 0:1]
+        cy = centers[start:start + step, 1:2]
+        signed = _edge_contributions(xi - cx, yi - cy, xj - cx, yj - cy, r)
+        areas[start:start + step] = np.abs(signed.sum(axis=1))
+    return areas
+
+
+def circle_intersection_area(r1, r2, d) -> np.ndarray:
+    """
+    Площадь пересечения двух окружностей для массива расстояний между центрами.
+    Векторный аналог Region._calculate_intersection_area; r1 и r2 — числа или массивы
+    той же формы, что и d.
+    """
+    d = np.asarray(d, dtype=np.float64)
+    r1 = np.broadcast_to(np.asarray(r1, dtype=np.float64), d.shape)
+    r2 = np.broadcast_to(np.asarray(r2, dtype=np.float64), d.shape)
+    area = np.zeros_like(d)
+
+    # Одна окружность полностью внутри другой
+    inner = d <= np.abs(r1 - r2)
+    area[inner] = math.pi * np.minimum(r1[inner], r2[inner]) ** 2
+
+    # Частичное пересечение
+    part = (d < r1 + r2) & ~inner
+    dp = d[part]
+    r1p = r1[part]
+    r2p = r2[part]
+    r1_sq = r1p ** 2
+    r2_sq = r2p ** 2
+    alpha = np.arccos((r1_sq + dp ** 2 - r2_sq) / (2 * r1p * dp))
+    beta = np.arccos((r2_sq + dp ** 2 - r1_sq) / (2 * r2p * dp))
+    area[part] = r1_sq * alpha + r2_sq * beta - \
+        0.5 * np.sqrt((-dp + r1p + r2p) * (dp + r1p - r2p) * (dp - r1p + r2p) * (dp + r1p + r2p))
+    return area
@@ -0,0 +1,160 @@
+import csv
+import json
+import os
+
+INPUT_FORMATS = ("geojson", "ndjson", "csv")
+
+
+def _as_ring(points) -> list[tuple]:
+    ring = [(float(p[0]), float(p[1])) for p in points]
+    # В GeoJSON кольцо замкнуто: последняя точка повторяет первую
+    if len(ring) > 1 and ring[0] == ring[-1]:
+        ring.pop()
+    return ring
+
+
+def _from_geometry(geometry: dict) -> dict:
+    """Геометрия GeoJSON (Polygon или MultiPolygon) -> аргументы Region coordinates/holes/parts."""
+    kind = geometry.get("type")
+    if kind == "Polygon":
+        polygons = [geometry["coordinates"]]
+    elif kind == "MultiPolygon":
+        polygons = geometry["coordinates"]
+    else:
+        raise ValueError(f"Unsupported geometry type: {kind}")
+    if not polygons:
+        raise ValueError("Empty geometry")
+    rings = [[_as_ring(ring) for ring in polygon] for polygon in polygons]
+    return {"coordinates": rings[0][0], "holes": rings[0][1:] or None, "parts": rings[1:] or None}
+
+
+def _record_id(record: dict, default_id):
+    if record.get("type") == "Feature":
+        properties = record.get("properties") or {}
+        return record.get("id", properties.get("id", properties.get("name", default_id)))
+    if record.get("type") in ("Polygon", "MultiPolygon"):
+        return default_id
+    return record.get("id", default_id)
+
+
+def _from_record(record: dict, default_id) -> tuple:
+    """Объект GeoJSON (Feature, геометрия) или словарь {"id", "coordinates", "holes", "parts"}."""
+    if not isinstance(record, dict):
+        raise ValueError("record is not an object")
+    region_id = _record_id(record, default_id)
+    if record.get("type") == "Feature":
+        if not isinstance(record.get("geometry"), dict):
+            raise ValueError("feature has no geometry")
+        return region_id, _from_geometry(record["geometry"])
+    if record.get("type") in ("Polygon", "MultiPolygon"):
+        return region_id, _from_geometry(record)
+    if "coordinates" not in record:
+        raise ValueError("record has no coordinates")
+    return region_id, {
+        "coordinates": _as_ring(record["coordinates"]),
+        "holes": [_as_ring(ring) for ring in record.get("holes") or []] or None,
+        "parts": [[_as_ring(ring) for ring in part] for part in record.get("parts") or []] or None,
+    }
+
+
+def _parse_record(record, default_id) -> tuple:
+    """
+    Как _from_record, но некорректная запись не прерывает чтение: вместо геометрии
+    выдается {"error": текст}, и регион попадает в результаты с ошибкой.
+    """
+    try:
+        return _from_record(record, default_id)
+    except (ValueError, KeyError, TypeError, IndexError) as error:
+        region_id = _record_id(record, default_id) if isinstance(record, dict) else default_id
+        return region_id, {"error": f"Invalid region record: {error}"}
+
+
+def _read_geojson(file):
+    data = json.load(file)
+    if data.get("type") == "FeatureCollection":
+        records = data.get("features", [])
+    else:
+        records = [data]
+    for index, record in enumerate(records):
+        yield _parse_record(record, index)
+
+
+def _read_ndjson(file):
+    index = 0
+    for line in file:
+        if line.strip():
+            try:
+                record = json.loads(line)
+            except ValueError as error:
+                yield index, {"error": f"Invalid JSON line: {error}"}
+            else:
+                yield _parse_record(record, index)
+            index += 1
+
+
+def _read_csv(file):
+    """
+    CSV с вершинами по одной в строке: id, x, y и необязательная колонка ring
+    (0 — внешнее кольцо, 1, 2, ... — вырезы). Строки одного региона идут подряд.
+    Разделитель ',' или ';'.
+    """
+    header = file.readline().lstrip("\ufeff")
+    delimiter = ";" if header.count(";") > header.count(",") else ","
+    fieldnames = [name.strip() for name in next(csv.reader([header], delimiter=delimiter))]
+    missing = [name for name in ("id", "x", "y") if name not in fieldnames]
+    if missing:
+        raise ValueError(f"CSV has no columns: {', '.join(missing)}")
+    reader = csv.DictReader(file, fieldnames=fieldnames, delimiter=delimiter)
+    current_id = None
+    rings = {}
+    error = None
+    for row in reader:
+        region_id = row["id"]
+        if region_id != current_id and (rings or error):
+            yield current_id, {"error": error} if error else _rings_to_geometry(rings)
+            rings = {}
+            error = None
+        current_id = region_id
+        try:
+            ring = int(row.get("ring") or 0)
+            point = (float(row["x"]), float(row["y"]))
+        except (ValueError, TypeError) as row_error:
+            # Ошибка вершины портит только свой регион; первая сохраняется в результате
+            error = error or f"Invalid CSV row {reader.line_num}: {row_error}"
+            continue
+        rings.setdefault(ring, []).append(point)
+    if rings or error:
+        yield current_id, {"error": error} if error else _rings_to_geometry(rings)
+
+
+def _rings_to_geometry(rings: dict) -> dict:
+    holes = [rings[key] for key in sorted(rings) if key != 0]
+    return {"coordinates": rings.get(0, []), "holes": holes or None, "parts": None}
+
+
+def detect_format(path: str) -> str:
+    """Формат по расширению файла (.geojson/.json, .ndjson/.jsonl, .csv)."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".geojson", ".json"):
+        return "geojson"
+    if extension in (".ndjson", ".jsonl"):
+        return "ndjson"
+    if extension == ".csv":
+        return "csv"
+    raise ValueError(f"Cannot detect input format of {path}")
+
+
+def read_regions(file, fmt: str):
+    """
+    Читает регионы из открытого текстового файла. Выдает пары (id, геометрия),
+    где геометрия — словарь coordinates/holes/parts для Region или place_regions,
+    а для некорректной записи — {"error": текст}.
+    NDJSON и CSV читаются построчно, GeoJSON — целиком.
+    """
+    if fmt not in INPUT_FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}")
+    if fmt == "geojson":
+        return _read_geojson(file)
+    if fmt == "ndjson":
+        return _read_ndjson(file)
+    return _read_csv(file)
@@ -0,0 +1,111 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+
+def _tier_name(tier_index: int) -> str:
+    return f'r{tier_index + 1}_centers'
+
+
+class TowerLayout(Mapping):
+    """
+    Размещение вышек всех ярусов в одном непрерывном массиве float64 формы (N, 3)
+    с колонками x, y, номер яруса (1, 2, ...). Строки упорядочены по ярусам, поэтому
+    центры яруса — срез data[start:stop, :2] без копирования.
+    Ведет себя как словарь {'r1_centers': массив (N1, 2), ...} только для чтения;
+    число вышек по ярусам берется из границ ярусов за O(1).
+    """
+    def __init__(self, data: np.ndarray, tier_count: int = None):
+        if data.ndim != 2 or data.shape[1] != 3:
+            raise ValueError("Layout data must have shape (N, 3).")
+        self.data = data
+        tier_column = data[:, 2]
+        if tier_count is None:
+            # Ярусы отсортированы: последний номер — в последней строке
+            tier_count = int(tier_column[-1]) if len(data) else 0
+        self.tier_count = tier_count
+        # Границы ярусов двоичным поиском: для отображенного в память файла читается O(log N) страниц
+        self.starts = np.searchsorted(tier_column, np.arange(1, tier_count + 2), side='left')
+
+    @classmethod
+    def from_tiers(cls, tiers: list) -> "TowerLayout":
+        """Собирает размещение из списка массивов центров (N_i, 2) по ярусам."""
+        arrays = [np.asarray(centers, dtype=np.float64).reshape(-1, 2) for centers in tiers]
+        data = np.empty((sum(len(a) for a in arrays), 3), dtype=np.float64)
+        start = 0
+        for i, centers in enumerate(arrays):
+            stop = start + len(centers)
+            data[start:stop, :2] = centers
+            data[start:stop, 2] = i + 1
+            start = stop
+        # Центры ярусов отдаются наружу представлениями: запись в них испортила бы размещение
+        data.flags.writeable = False
+        return cls(data, len(arrays))
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "TowerLayout":
+        """
+        Загружает размещение, сохраненное save. При mmap=True файл отображается в память
+        и читается по мере обращения к ярусам.
+        """
+        stored = np.load(path, mmap_mode='r' if mmap else None)
+        if not mmap:
+            stored.flags.writeable = False
+        return cls(stored[1:], int(stored[0, 0]))
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет размещение в формате .npy: массив (N + 1, 3), первая строка —
+        заголовок (число ярусов, 0, 0), чтобы пустые последние ярусы не терялись.
+        """
+        header = np.array([[self.tier_count, 0.0, 0.0]])
+        np.save(path, np.concatenate((header, self.data)))
+
+    def tier(self, tier_index: int) -> np.ndarray:
+        """Центры яруса tier_index (с нуля) — представление формы (N_i, 2) без копирования."""
+        if not 0 <= tier_index < self.tier_count:
+            raise IndexError(f"Tier {tier_index} is out of range.")
+        return self.data[self.starts[tier_index]:self.starts[tier_index + 1], :2]
+
+    def tier_arrays(self) -> list[np.ndarray]:
+        return [self.tier(i) for i in range(self.tier_count)]
+
+    @property
+    def xy(self) -> np.ndarray:
+        """Центры всех ярусов формы (N, 2)."""
+        return self.data[:, :2]
+
+    @property
+    def tiers(self) -> np.ndarray:
+        """Номер яруса (1, 2, ...) для каждой вышки."""
+        return self.data[:, 2]
+
+    def counts(self) -> dict:
+        """Число вышек по ярусам {'r1_centers': N1, ...}."""
+        sizes = np.diff(self.starts).tolist()
+        return {_tier_name(i): size for i, size in enumerate(sizes)}
+
+    def total(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        for i in range(self.tier_count):
+            if _tier_name(i) == name:
+                return self.tier(i)
+        raise KeyError(name)
+
+    def __iter__(self):
+        return (_tier_name(i) for i in range(self.tier_count))
+
+    def __len__(self):
+        return self.tier_count
+
+    def __eq__(self, other):
+        if isinstance(other, TowerLayout):
+            return self.tier_count == other.tier_count and np.array_equal(self.data, other.data)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"TowerLayout({self.counts()})"
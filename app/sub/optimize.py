@@ -0,0 +1,126 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def _rotate(points: np.ndarray, center: tuple, angle: float) -> np.ndarray:
+    """Поворачивает точки формы (N, 2) на angle градусов вокруг center."""
+    c = math.cos(math.radians(angle))
+    s = math.sin(math.radians(angle))
+    d = np.asarray(points, dtype=np.float64).reshape(-1, 2) - center
+    return np.column_stack((center[0] + c * d[:, 0] - s * d[:, 1],
+                            center[1] + s * d[:, 0] + c * d[:, 1]))
+
+
+def layout_candidates(offsets: int, angles: int) -> list[tuple]:
+    """
+    Варианты сетки (сдвиг x, сдвиг y, угол): сдвиги — доли периода сетки
+    по осям (offsets x offsets значений), углы — равномерно в [0, 60) градусов
+    (у гексагональной сетки симметрия 60 градусов). Первым идет исходный вариант (0, 0, 0).
+    """
+    phases = [i / offsets for i in range(offsets)]
+    steps = [60.0 * i / angles for i in range(angles)]
+    return [(fx, fy, angle) for angle in steps for fy in phases for fx in phases]
+
+
+def _rotated_geometry(geometry: dict, center: tuple, angle: float) -> dict:
+    """Кольца региона (coordinates, holes, parts), повернутые на angle градусов."""
+    def turn(ring):
+        return [tuple(point) for point in _rotate(ring, center, angle).tolist()]
+    return {
+        'coordinates': turn(geometry['coordinates']),
+        'holes': [turn(hole) for hole in geometry['holes']] if geometry['holes'] else None,
+        'parts': [[turn(ring) for ring in part] for part in geometry['parts']] if geometry['parts'] else None,
+    }
+
+
+def _place_layout(region_class, geometry: dict, options: dict, tiers: list[tuple],
+                  approximate: bool, candidate: tuple, bound: int):
+    """
+    Размещает все ярусы для одного варианта сетки. Регион поворачивается на -angle,
+    сетка строится со сдвигом, центры поворачиваются обратно.
+    Возвращает список массивов центров или None, если вышек уже не меньше bound.
+    """
+    fx, fy, angle = candidate
+    center = options['center']
+    if angle:
+        geometry = _rotated_geometry(geometry, center, -angle)
+    region = region_class(**geometry, seed=options['seed'], sampler=options['sampler'])
+    region.lattice_phase = (fx, fy)
+
+    circles = []
+    total = 0
+    for i in range(len(tiers)):
+        circles.append(region._pack_tier(i, tiers, circles, approximate, 1))
+        total += len(circles[-1])
+        # Следующие ярусы только добавляют вышки: вариант уже не лучше найденного
+        if bound is not None and total >= bound:
+            return None
+    if angle:
+        circles = [_rotate(c, center, angle) for c in circles]
+    return circles
+
+
+def _search_chunk(region_class, geometry: dict, options: dict, tiers: list[tuple],
+                  approximate: bool, chunk: list[tuple], bound: int):
+    """Перебирает варианты по порядку, сужая границу; возвращает лучший (индекс, центры) или None."""
+    best = None
+    for index, candidate in chunk:
+        circles = _place_layout(region_class, geometry, options, tiers, approximate, candidate, bound)
+        if circles is not None:
+            bound = sum(len(c) for c in circles)
+            best = (index, circles)
+    return best
+
+
+def _layout_args(region):
+    """Класс, геометрия и параметры региона для расчета вариантов сетки в процессах пула."""
+    (min_x, min_y), (max_x, max_y) = region.rectangle
+    geometry = {'coordinates': region.coordinates, 'holes': region.holes or None,
+                'parts': region.parts or None}
+    options = {'seed': region.seed, 'sampler': region.sampler,
+               'center': ((min_x + max_x) / 2, (min_y + max_y) / 2)}
+    return type(region), geometry, options
+
+
+def place_layout(region, tiers: list[tuple], approximate: bool, candidate: tuple) -> list:
+    """Размещает все ярусы на одном варианте сетки (fx, fy, angle), например найденном search_layout."""
+    region_class, geometry, options = _layout_args(region)
+    return _place_layout(region_class, geometry, options, tiers, approximate, candidate, None)
+
+
+def search_layout(region, tiers: list[tuple], approximate: bool = False, offsets: int = 3,
+                  angles: int = 6, workers: int = 1):
+    """
+    Ищет сдвиг и поворот сетки, при которых всех вышек меньше всего, а каждая вышка
+    по-прежнему проходит проверку процента. Сначала считается исходный вариант,
+    его число вышек — начальная граница; вариант отбрасывается, как только сумма
+    по уже размещенным ярусам достигает границы. При равенстве остается более ранний
+    вариант, поэтому результат не зависит от числа процессов.
+    Возвращает (вариант (fx, fy, angle), список массивов центров по ярусам).
+    """
+    region_class, geometry, options = _layout_args(region)
+    candidates = layout_candidates(offsets, angles)
+
+    best_index = 0
+    best = _place_layout(region_class, geometry, options, tiers, approximate, candidates[0], None)
+    bound = sum(len(c) for c in best)
+    rest = list(enumerate(candidates))[1:]
+    if workers <= 1:
+        results = [_search_chunk(region_class, geometry, options, tiers, approximate, rest, bound)]
+    else:
+        # Чередование распределяет углы по процессам равномерно
+        chunks = [rest[i::workers * 2] for i in range(min(len(rest), workers * 2))]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_search_chunk, region_class, geometry, options, tiers,
+                                   approximate, chunk, bound) for chunk in chunks]
+            results = [future.result() for future in futures]
+    for result in results:
+        if result is None:
+            continue
+        index, circles = result
+        key = (sum(len(c) for c in circles), index)
+        if key < (sum(len(c) for c in best), best_index):
+            best_index, best = index, circles
+    return candidates[best_index], best
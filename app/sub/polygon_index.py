@@ -0,0 +1,184 @@
+import math
+
+import numpy as np
+
+# Состояния ячеек растра
+OUTSIDE = 0
+INSIDE = 1
+BOUNDARY = 2
+
+
+def _expand_ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Разворачивает диапазоны [start, start + count) в один плоский массив индексов."""
+    total = int(counts.sum())
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + offsets
+
+
+class PolygonIndex:
+    """
+    Ускоряющая структура для проверки принадлежности точек многоугольнику.
+    Ограничивающий прямоугольник делится на грубый растр. Ячейки, которых не касается
+    ни одно ребро (с запасом в одну ячейку), заранее помечены как внутренние
+    или внешние — точки в них определяются за O(1). В граничных ячейках
+    точка проверяется только по ребрам своей горизонтальной полосы (строки растра),
+    а не по всем n ребрам.
+    """
+    def __init__(self, edges, rectangle, resolution: int = None):
+        xi, yi, xj, yj = edges
+        (min_x, min_y), (max_x, max_y) = rectangle
+        n = len(xi)
+        if resolution is None:
+            resolution = int(np.clip(2 * math.ceil(math.sqrt(n)), 8, 1024))
+
+        width = max_x - min_x
+        height = max_y - min_y
+        # Ячейки близки к квадратным
+        if width >= height:
+            self.nx = resolution
+            self.ny = max(1, math.ceil(resolution * height / width)) if width > 0 else 1
+        else:
+            self.ny = resolution
+            self.nx = max(1, math.ceil(resolution * width / height))
+        self.x0 = float(min_x)
+        self.y0 = float(min_y)
+        self.cell_w = width / self.nx if width > 0 else 1.0
+        self.cell_h = height / self.ny if height > 0 else 1.0
+        self.edges = edges
+
+        # Горизонтальные полосы: для каждой строки растра — ребра, пересекающие ее по y
+        row_lo = self._rows(np.minimum(yi, yj))
+        row_hi = self._rows(np.maximum(yi, yj))
+        counts = row_hi - row_lo + 1
+        pair_edges = np.repeat(np.arange(n), counts)
+        pair_rows = _expand_ranges(row_lo, counts)
+        order = np.argsort(pair_rows, kind='stable')
+        self.slab_edges = pair_edges[order]
+        self.slab_starts = np.searchsorted(pair_rows[order], np.arange(self.ny + 1))
+
+        self.state = self._classify(pair_rows, pair_edges)
+        # Префиксные суммы для проверки прямоугольников (окружностей) целиком
+        self._inside_sums = self._prefix_sums(self.state == INSIDE)
+        self._outside_sums = self._prefix_sums(self.state == OUTSIDE)
+
+    def _rows(self, y) -> np.ndarray:
+        return np.clip(np.floor((y - self.y0) / self.cell_h), 0, self.ny - 1).astype(np.int64)
+
+    def _cols(self, x) -> np.ndarray:
+        return np.clip(np.floor((x - self.x0) / self.cell_w), 0, self.nx - 1).astype(np.int64)
+
+    def _classify(self, pair_rows: np.ndarray, pair_edges: np.ndarray) -> np.ndarray:
+        """Помечает граничные ячейки, остальные классифицирует по центру."""
+        xi, yi, xj, yj = (a[pair_edges] for a in self.edges)
+        state = np.zeros((self.ny, self.nx), dtype=np.uint8)
+
+        # Участок ребра внутри своей полосы: отрезаем по y и берем диапазон x
+        band_lo = self.y0 + pair_rows * self.cell_h
+        band_hi = band_lo + self.cell_h
+        dy = yj - yi
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_lo = np.clip((band_lo - yi) / dy, 0.0, 1.0)
+            t_hi = np.clip((band_hi - yi) / dy, 0.0, 1.0)
+        flat = dy == 0
+        t_lo[flat] = 0.0
+        t_hi[flat] = 1.0
+        x_a = xi + t_lo * (xj - xi)
+        x_b = xi + t_hi * (xj - xi)
+        col_lo = self._cols(np.minimum(x_a, x_b))
+        col_hi = self._cols(np.maximum(x_a, x_b))
+        counts = col_hi - col_lo + 1
+        state[np.repeat(pair_rows, counts), _expand_ranges(col_lo, counts)] = BOUNDARY
+
+        # Запас в одну ячейку во все стороны: вне граничных ячеек точки далеки от ребер,
+        # и результат не зависит от погрешностей округления
+        boundary = state == BOUNDARY
+        padded = np.pad(boundary, 1)
+        dilated = np.zeros_like(boundary)
+        for oy in (0, 1, 2):
+            for ox in (0, 1, 2):
+                dilated |= padded[oy:oy + self.ny, ox:ox + self.nx]
+        state[dilated] = BOUNDARY
+
+        # Остальные ячейки однородны: достаточно проверить центр по ребрам его полосы
+        xi, yi, xj, yj = self.edges
+        centers_x = self.x0 + (np.arange(self.nx) + 0.5) * self.cell_w
+        for row in range(self.ny):
+            free = np.flatnonzero(state[row] != BOUNDARY)
+            if free.size == 0:
+                continue
+            e = self.slab_edges[self.slab_starts[row]:self.slab_starts[row + 1]]
+            yc = self.y0 + (row + 0.5) * self.cell_h
+            crosses = (yi[e] > yc) != (yj[e] > yc)
+            e = e[crosses]
+            x_cross = np.sort((xj[e] - xi[e]) * (yc - yi[e]) / (yj[e] - yi[e]) + xi[e])
+            # Число пересечений правее центра: x < x_cross
+            right = len(x_cross) - np.searchsorted(x_cross, centers_x[free], side='right')
+            state[row, free] = np.where(right & 1, INSIDE, OUTSIDE)
+        return state
+
+    @staticmethod
+    def _prefix_sums(mask: np.ndarray) -> np.ndarray:
+        sums = np.zeros((mask.shape[0] + 1, mask.shape[1] + 1), dtype=np.int64)
+        sums[1:, 1:] = mask.cumsum(axis=0).cumsum(axis=1)
+        return sums
+
+    def contains(self, x: np.ndarray, y: np.ndarray, chunk_size: int = 1 << 20) -> np.ndarray:
+        """
+        Принадлежность точек (внутри ограничивающего прямоугольника) по правилу чет-нечет.
+        Результат совпадает с полным перебором ребер.
+        """
+        rows = self._rows(y)
+        state = self.state[rows, self._cols(x)]
+        result = state == INSIDE
+        idx = np.flatnonzero(state == BOUNDARY)
+        if idx.size == 0:
+            return result
+
+        xi, yi, xj, yj = self.edges
+        counts = self.slab_starts[rows[idx] + 1] - self.slab_starts[rows[idx]]
+        cumulative = np.cumsum(counts)
+        start = 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            while start < idx.size:
+                # Блок ограничен числом пар точка-ребро
+                done = cumulative[start - 1] if start else 0
+                stop = max(start + 1, int(np.searchsorted(cumulative, done + chunk_size, side='right')))
+                part = idx[start:stop]
+                part_counts = counts[start:stop]
+                owner = np.repeat(np.arange(part.size), part_counts)
+                e = self.slab_edges[_expand_ranges(self.slab_starts[rows[part]], part_counts)]
+                px = x[part][owner]
+                py = y[part][owner]
+                # Порядок операций совпадает со скалярной версией
+                crosses = (yi[e] > py) != (yj[e] > py)
+                intersect = crosses & (px < (xj[e] - xi[e]) * (py - yi[e]) / (yj[e] - yi[e]) + xi[e])
+                hits = np.bincount(owner[intersect], minlength=part.size)
+                result[part] = (hits & 1).astype(bool)
+                start = stop
+        return result
+
+    def box_state(self, x_lo, y_lo, x_hi, y_hi) -> np.ndarray:
+        """
+        Для прямоугольников возвращает INSIDE, если все их ячейки внутренние,
+        OUTSIDE — если все внешние (или прямоугольник вне растра), иначе BOUNDARY.
+        """
+        c0 = np.floor((x_lo - self.x0) / self.cell_w).astype(np.int64)
+        c1 = np.floor((x_hi - self.x0) / self.cell_w).astype(np.int64)
+        r0 = np.floor((y_lo - self.y0) / self.cell_h).astype(np.int64)
+        r1 = np.floor((y_hi - self.y0) / self.cell_h).astype(np.int64)
+        beyond = (c1 < 0) | (c0 >= self.nx) | (r1 < 0) | (r0 >= self.ny)
+        sticks_out = (c0 < 0) | (c1 >= self.nx) | (r0 < 0) | (r1 >= self.ny)
+
+        c0 = np.clip(c0, 0, self.nx - 1)
+        c1 = np.clip(c1, 0, self.nx - 1)
+        r0 = np.clip(r0, 0, self.ny - 1)
+        r1 = np.clip(r1, 0, self.ny - 1)
+        total = (c1 - c0 + 1) * (r1 - r0 + 1)
+
+        def box_sum(sums):
+            return sums[r1 + 1, c1 + 1] - sums[r0, c1 + 1] - sums[r1 + 1, c0] + sums[r0, c0]
+
+        result = np.full(len(total), BOUNDARY, dtype=np.uint8)
+        result[~sticks_out & (box_sum(self._inside_sums) == total)] = INSIDE
+        result[beyond | (box_sum(self._outside_sums) == total)] = OUTSIDE
+        return result
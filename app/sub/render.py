@@ -0,0 +1,120 @@
+"""
+Отрисовка размещения вышек. Модуль импортирует matplotlib, поэтому ядро расчета
+(base_region и остальные модули sub) его не импортирует: sub.visualize_towers
+и base_region.visualize_towers загружают этот модуль при первом обращении.
+"""
+import numpy as np
+from matplotlib.collections import EllipseCollection
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.patches import Polygon
+
+from .base_region import Region, _tier_name
+
+# Цвета ярусов при отрисовке (по кругу, если ярусов больше)
+TIER_COLORS = ('blue', 'green', 'red', 'orange', 'purple', 'brown')
+
+
+def _draw_density(ax, centers: np.ndarray, color: str, extent: tuple, bins: int):
+    """Ярус как растр плотности вышек одного цвета (вместо отдельных окружностей)."""
+    (min_x, min_y), (max_x, max_y) = extent
+    density, _, _ = np.histogram2d(centers[:, 0], centers[:, 1], bins=bins,
+                                   range=[[min_x, max_x], [min_y, max_y]])
+    rgba = np.zeros(density.T.shape + (4,))
+    rgba[..., :3] = to_rgba(color)[:3]
+    rgba[..., 3] = 0.7 * density.T / max(density.max(), 1)
+    ax.imshow(rgba, origin='lower', extent=(min_x, max_x, min_y, max_y),
+              interpolation='nearest', aspect='auto', zorder=1)
+
+
+def visualize_towers(region: Region, *radii: float, path: str = None, lod_threshold: int = None,
+                     density_bins: int = 256, dpi: int = 150):
+    """
+    Визуализирует регион и размещенные башни.
+    
+    Args:
+        region: Экземпляр класса Region.
+        radii: Радиусы ярусов r1, r2, ... для отрисовки (по умолчанию — расчетные радиусы региона).
+        path: Файл для сохранения (PNG, SVG, PDF — по расширению). Если задан, окно не
+            открывается и дисплей не нужен; функция возвращает фигуру.
+        lod_threshold: Ярус, в котором вышек больше этого числа, рисуется растром
+            плотности density_bins x density_bins вместо отдельных окружностей.
+        dpi: Разрешение растровых форматов.
+    """
+    results = region.get_centers_of_towers()
+        
+    if not results:
+        print("Нет данных для визуализации (results пуст).")
+        return
+    if not radii:
+        radii = tuple(tier['radius'] for tier in region._tiers)
+
+    if path is None:
+        # pyplot (и оконная подсистема) нужен только для показа на экране
+        import matplotlib.pyplot as plt
+        fig, ax = plt.subplots(figsize=(10, 10))
+    else:
+        # Без pyplot: фигура не регистрируется в оконной системе
+        fig = Figure(figsize=(10, 10))
+        ax = fig.add_subplot()
+    
+    # 1. Отрисовка границ региона (внешние кольца и вырезы)
+    for index, (ring, is_hole) in enumerate(region.get_rings()):
+        poly_patch = Polygon(ring, 
+                             closed=True, 
+                             fill=False, 
+                             edgecolor='black', 
+                             linewidth=1 if is_hole else 2, 
+                             linestyle='--' if is_hole else '-',
+                             label='Граница региона' if index == 0 else None,
+                             zorder=3)
+        ax.add_patch(poly_patch)
+    
+    # Автоматическое масштабирование осей
+    (min_x, min_y), (max_x, max_y) = region.rectangle
+    # Добавляем самый большой радиус к границам графика, чтобы круги не обрезались
+    margin = radii[0] * 1.2
+    ax.set_xlim(min_x - margin, max_x + margin)
+    ax.set_ylim(min_y - margin, max_y + margin)
+    
+    # 2. Функция для отрисовки слоя: все окружности яруса — одна коллекция
+    def plot_layer(centers, radius, color, label_prefix):
+        centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+        if len(centers) == 0:
+            return
+        
+        # Добавляем в легенду только первую точку слоя
+        ax.plot([], [], color=color, marker='o', linestyle='None', 
+                alpha=0.5, markersize=10, 
+                label=f"{label_prefix} (R={radius}, N={len(centers)})")
+
+        if lod_threshold is not None and len(centers) > lod_threshold:
+            extent = ((min_x - margin, min_y - margin), (max_x + margin, max_y + margin))
+            _draw_density(ax, centers, color, extent, density_bins)
+            return
+        
+        ax.add_collection(EllipseCollection(2 * radius, 2 * radius, 0, units='xy', offsets=centers,
+                                            offset_transform=ax.transData, facecolors=color,
+                                            alpha=0.4, linewidths=0))
+        # Точки в центрах
+        ax.plot(centers[:, 0], centers[:, 1], '.', color='black', markersize=1, alpha=0.3)
+
+    # 3. Рисуем слои (от больших к маленьким)
+    for i, radius in enumerate(radii):
+        name = _tier_name(i)
+        if name in results:
+            plot_layer(results[name], radius, TIER_COLORS[i % len(TIER_COLORS)], f'Tower R{i + 1}')
+
+    # 4. Настройки
+    ax.set_aspect('equal')
+    ax.grid(True, linestyle='--', alpha=0.3)
+    
+    total_towers = sum(len(v) for v in results.values())
+    ax.set_title(f"Размещение башен: Всего {total_towers} шт.")
+    ax.legend(loc='upper right')
+    
+    if path is None:
+        plt.show()
+        return None
+    fig.savefig(path, dpi=dpi)
+    return fig
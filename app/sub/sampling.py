@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+
+# Угол золотого сечения для «подсолнечника»
+GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+SAMPLER_KINDS = ("sunflower", "halton", "random")
+
+
+def _radical_inverse(indexes: np.ndarray, base: int) -> np.ndarray:
+    """Обратная запись индекса в системе счисления base — координата последовательности Холтона."""
+    result = np.zeros(len(indexes), dtype=np.float64)
+    fraction = 1.0 / base
+    indexes = indexes.copy()
+    while np.any(indexes > 0):
+        result += (indexes % base) * fraction
+        indexes //= base
+        fraction /= base
+    return result
+
+
+class DiskSampler:
+    """
+    Фиксированный набор точек в единичном круге, общий для всех кандидатов.
+    Точки масштабируются радиусом и сдвигаются в центр окружности, поэтому
+    одинаковые входные данные всегда дают одинаковые решения.
+    kind: 'sunflower' (спираль с золотым углом), 'halton' (последовательность Холтона
+    по основаниям 2 и 3) или 'random' (псевдослучайные точки от seed).
+    seed задает поворот спирали, сдвиг Холтона или состояние генератора.
+    """
+    def __init__(self, samples: int, seed: int = 0, kind: str = "sunflower"):
+        if samples <= 0:
+            raise ValueError("samples must be positive.")
+        if kind not in SAMPLER_KINDS:
+            raise ValueError(f"Unknown sampler kind: {kind}")
+        self.samples = samples
+        self.seed = seed
+        self.kind = kind
+
+        rng = np.random.default_rng(seed)
+        k = np.arange(samples)
+        if kind == "sunflower":
+            dist = np.sqrt((k + 0.5) / samples)
+            angle = k * GOLDEN_ANGLE + rng.random() * 2 * math.pi
+        elif kind == "halton":
+            # Случайный сдвиг по модулю 1 (Крэнли-Паттерсон) сохраняет равномерность
+            shift = rng.random(2)
+            u = (_radical_inverse(k + 1, 2) + shift[0]) % 1.0
+            v = (_radical_inverse(k + 1, 3) + shift[1]) % 1.0
+            dist = np.sqrt(u)
+            angle = v * 2 * math.pi
+        else:
+            dist = np.sqrt(rng.random(samples))
+            angle = rng.random(samples) * 2 * math.pi
+        # Точки единичного круга формы (samples, 2)
+        self.points = np.column_stack((dist * np.cos(angle), dist * np.sin(angle)))
+
+    def place(self, centers: np.ndarray, r: float) -> np.ndarray:
+        """Точки для каждого центра: массив формы (N * samples, 2), по samples подряд на центр."""
+        centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+        placed = centers[:, None, :] + r * self.points[None, :, :]
+        return placed.reshape(-1, 2)
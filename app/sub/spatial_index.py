@@ -0,0 +1,88 @@
+import numpy as np
+
+from .polygon_index import _expand_ranges
+
+
+class GridIndex:
+    """
+    Равномерная сетка для поиска соседних окружностей.
+    Размер ячейки равен радиусу поиска, поэтому все точки ближе cell_size
+    к запросу лежат в соседних 3x3 ячейках.
+    cell_size может задаваться для каждой точки: точки с одинаковым радиусом поиска
+    образуют отдельную сетку внутри индекса, и запрос к ней смотрит только на ее соседей.
+    """
+    # Ключ ячейки: iy * _KEY_BASE + ix (упорядочен по строкам, как и точки сетки кандидатов,
+    # поэтому двоичный поиск по ключам запросов идет почти последовательно)
+    _KEY_BASE = 1 << 32
+
+    def __init__(self, points, cell_size):
+        self.points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        sizes = np.broadcast_to(np.asarray(cell_size, dtype=np.float64), (len(self.points),))
+        if np.any(np.asarray(cell_size) <= 0):
+            raise ValueError("cell_size must be positive.")
+
+        # Сетка на каждый радиус поиска: (размер ячейки, точки по ячейкам, ключи, начала, длины)
+        self.buckets = []
+        for size in np.unique(sizes).tolist():
+            members = np.flatnonzero(sizes == size)
+            keys = self._keys(self.points[members], size)
+            # Стабильная сортировка сохраняет исходный порядок точек внутри ячейки
+            order = np.argsort(keys, kind='stable')
+            cell_keys, cell_starts, cell_counts = np.unique(keys[order], return_index=True, return_counts=True)
+            self.buckets.append((size, members[order], cell_keys, cell_starts, cell_counts))
+
+    @staticmethod
+    def _cells(points: np.ndarray, cell_size: float):
+        cells = np.floor(points / cell_size).astype(np.int64)
+        return cells[:, 0], cells[:, 1]
+
+    def _keys(self, points: np.ndarray, cell_size: float) -> np.ndarray:
+        ix, iy = self._cells(points, cell_size)
+        return iy * self._KEY_BASE + ix
+
+    def _neighbour_cells(self, queries: np.ndarray):
+        """
+        Для каждой сетки индекса и каждой из 3x3 соседних ячеек выдает
+        (порядок точек сетки, номера запросов с непустой ячейкой, начала и длины ячеек).
+        """
+        for size, points_order, cell_keys, cell_starts, cell_counts in self.buckets:
+            qx, qy = self._cells(queries, size)
+            for ox in (-1, 0, 1):
+                for oy in (-1, 0, 1):
+                    keys = (qy + oy) * self._KEY_BASE + (qx + ox)
+                    pos = np.searchsorted(cell_keys, keys)
+                    pos = np.minimum(pos, len(cell_keys) - 1)
+                    found = np.flatnonzero(cell_keys[pos] == keys)
+                    if found.size:
+                        yield points_order, found, cell_starts[pos[found]], cell_counts[pos[found]]
+
+    def max_pairs(self) -> int:
+        """Верхняя граница числа пар на одну точку запроса: 3x3 самых заполненных ячеек каждой сетки."""
+        return sum(9 * int(cell_counts.max()) for _, _, _, _, cell_counts in self.buckets)
+
+    def query_pairs(self, queries) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Для каждой точки запроса находит точки индекса из соседних ячеек.
+        Возвращает пары (индекс запроса, индекс точки), упорядоченные
+        по запросу, а внутри запроса — по исходному порядку точек.
+        Порядок важен: площади перекрытия накапливаются так же, как при полном переборе.
+        """
+        queries = np.asarray(queries, dtype=np.float64).reshape(-1, 2)
+        empty = np.empty(0, dtype=np.int64)
+        query_ids = []
+        point_ids = []
+        for points_order, found, starts, counts in self._neighbour_cells(queries):
+            query_ids.append(np.repeat(found, counts))
+            point_ids.append(points_order[_expand_ranges(starts, counts)])
+
+        if not query_ids:
+            return empty, empty
+        query_ids = np.concatenate(query_ids)
+        point_ids = np.concatenate(point_ids)
+        # Пары уникальны, поэтому сортировка по одному составному ключу равна lexsort по (запрос, точка)
+        order = np.argsort(query_ids * len(self.points) + point_ids)
+        return query_ids[order], point_ids[order]
+
+    def query(self, x: float, y: float) -> list[int]:
+        """Возвращает индексы точек из ячеек, соседних с (x, y), в исходном порядке."""
+        return self.query_pairs([(x, y)])[1].tolist()
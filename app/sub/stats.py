@@ -0,0 +1,52 @@
+import time
+from contextlib import contextmanager
+
+# Счетчики горячих участков и их подписи для отчета
+COUNTER_LABELS = {
+    'candidates': 'Кандидатов проверено',
+    'shortcut_inside': 'Ранний выход: центр внутри (<40%)',
+    'shortcut_outside': 'Ранний выход: центр снаружи (>60%)',
+    'coverage_evaluations': 'Оценок покрытия (площадь/точки)',
+    'axis_rejects': 'Отсев препятствий по осям',
+    'intersection_area_calls': 'Площадей пересечения окружностей',
+    'contains_calls': 'Проверок принадлежности точек',
+}
+
+
+class PlacementStats:
+    """
+    Счетчики и время расчета для Region (включаются параметром instrument=True).
+    Счетчики накапливаются между вызовами, время ярусов — за последний расчет яруса.
+    """
+    def __init__(self):
+        self.counters = dict.fromkeys(COUNTER_LABELS, 0)
+        self.tier_times = {}
+
+    def add(self, name: str, count: int = 1) -> None:
+        self.counters[name] += int(count)
+
+    def merge(self, counters: dict) -> None:
+        """Добавляет счетчики, собранные в другом процессе."""
+        for name, count in counters.items():
+            self.counters[name] += count
+
+    @contextmanager
+    def timer(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.tier_times[name] = time.perf_counter() - start
+
+    def reset(self) -> None:
+        self.counters = dict.fromkeys(COUNTER_LABELS, 0)
+        self.tier_times = {}
+
+    def as_dict(self) -> dict:
+        return {'counters': dict(self.counters), 'tier_times': dict(self.tier_times)}
+
+    def __str__(self):
+        lines = [f"  • {label}: {self.counters[name]}" for name, label in COUNTER_LABELS.items()]
+        for name, seconds in self.tier_times.items():
+            lines.append(f"  • Время {name.replace('_centers', '').upper()}: {seconds:.3f} с")
+        return "\n".join(lines)
@@ -1,5 +1,6 @@
 
-import base_region
+# Запуск из каталога app: python -m sub.tests
+from sub import base_region
 
 
 
@@ -1,9 +1,21 @@
 import csv
 import os
-import sys
+
+import numpy as np
+
+# Каталог по умолчанию лежит в каталоге app, рядом с main.py
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CATALOG = "Базовыестанции.csv"
+# Версия формата бинарной копии каталога (.npz рядом с CSV)
+SIDECAR_VERSION = 1
+
+# Загруженные каталоги: абсолютный путь -> (mtime_ns, размер файла, каталог)
+_catalogs = {}
 
 
 class Tower():
+    __slots__ = ("id_bs", "name", "square", "frequency", "type_antenna", "range_of_handrover", "standart")
+
     def __init__(self, id_bs:int, name:str, square:float, frequency:int, type_antenna:str, range_of_handrover, standart):
         self.id_bs = int(id_bs)
         self.name = name
@@ -12,15 +24,156 @@ class Tower():
         self.type_antenna = type_antenna
         self.range_of_handrover = range_of_handrover
         self.standart = standart
-        
 
-def parsing_base_station(filename:str="Базовыестанции.csv"):
-    script_dir = os.path.dirname(sys.argv[0])
 
-    with open(os.path.join(script_dir, filename), encoding = "UTF-8") as file:
+class TowerCatalog:
+    """
+    Каталог вышек в столбцовом виде, отсортированный по убыванию площади покрытия.
+    Числовые поля — массивы NumPy, строковые — массивы строк; объекты Tower
+    создаются только по запросу. Поиск по id_bs и названию — через словари,
+    по площади — двоичным поиском.
+    """
+    def __init__(self, id_bs, name, square, frequency, type_antenna, range_of_handrover, standart):
+        # Стабильная сортировка по убыванию площади, как sorted(..., reverse=True)
+        order = np.argsort(-np.asarray(square, dtype=np.float64), kind='stable')
+        self.id_bs = np.asarray(id_bs, dtype=np.int64)[order]
+        self.name = np.asarray(name, dtype=np.str_)[order]
+        self.square = np.asarray(square, dtype=np.float64)[order]
+        self.frequency = np.asarray(frequency, dtype=np.int64)[order]
+        self.type_antenna = np.asarray(type_antenna, dtype=np.str_)[order]
+        self.range_of_handrover = np.asarray(range_of_handrover, dtype=np.str_)[order]
+        self.standart = np.asarray(standart, dtype=np.str_)[order]
+
+        # Словари поиска строятся при первом обращении
+        self._by_id = None
+        self._by_name = None
+        self._towers = None
+
+    def __len__(self):
+        return len(self.id_bs)
+
+    def __getitem__(self, i: int) -> Tower:
+        return Tower(self.id_bs[i], str(self.name[i]), self.square[i], self.frequency[i],
+                     str(self.type_antenna[i]), str(self.range_of_handrover[i]), str(self.standart[i]))
+
+    def towers(self) -> list[Tower]:
+        """Список объектов Tower (строится один раз, каждый вызов возвращает новый список)."""
+        if self._towers is None:
+            self._towers = [self[i] for i in range(len(self))]
+        return list(self._towers)
+
+    def radii(self) -> np.ndarray:
+        """Радиусы зон покрытия всех вышек (в том же порядке)."""
+        return np.sqrt(self.square / np.pi)
+
+    def by_id(self, id_bs: int) -> Tower:
+        """Вышка по id_bs; KeyError, если такой нет."""
+        if self._by_id is None:
+            # При повторах берется первая (самая большая) вышка
+            self._by_id = {}
+            for i, value in enumerate(self.id_bs.tolist()):
+                self._by_id.setdefault(value, i)
+        return self[self._by_id[int(id_bs)]]
+
+    def by_name(self, name: str) -> Tower:
+        """Вышка по названию (без учета пробелов по краям); KeyError, если такой нет."""
+        if self._by_name is None:
+            self._by_name = {}
+            for i, value in enumerate(self.name.tolist()):
+                self._by_name.setdefault(value.strip(), i)
+        return self[self._by_name[name.strip()]]
+
+    def by_square(self, min_square: float, max_square: float) -> list[Tower]:
+        """Вышки с площадью покрытия в диапазоне [min_square, max_square] по убыванию площади."""
+        # Площади отсортированы по убыванию: ищем по отрицательным значениям
+        keys = -self.square
+        start = np.searchsorted(keys, -max_square, side='left')
+        stop = np.searchsorted(keys, -min_square, side='right')
+        return [self[i] for i in range(start, stop)]
+
+    def nearest_square(self, square: float) -> Tower:
+        """Вышка с площадью покрытия, ближайшей к square."""
+        if len(self) == 0:
+            raise KeyError("empty catalog")
+        keys = -self.square
+        i = int(np.searchsorted(keys, -square))
+        candidates = [j for j in (i - 1, i) if 0 <= j < len(self)]
+        return self[min(candidates, key=lambda j: abs(self.square[j] - square))]
+
+    def _columns(self) -> dict:
+        return {field: getattr(self, field) for field in Tower.__slots__}
+
+
+def _resolve_path(filename: str) -> str:
+    """Относительные пути считаются от каталога app, а не от текущего скрипта."""
+    if not os.path.isabs(filename):
+        filename = os.path.join(BASE_DIR, filename)
+    return os.path.abspath(filename)
+
+
+def _read_csv(path: str) -> TowerCatalog:
+    with open(path, encoding = "utf-8-sig", newline = "") as file:
         reader = csv.reader(file, delimiter=";")
-        next(reader)                                                                                        #пропускаем заголовок
-        towers = []
-        for row in reader:
-            towers.append(Tower(row[0], row[1], row[2].replace(",", "."), row[3], row[4], row[5], row[6]))  #заносим всё в массив для работы
-        return sorted(towers, key=lambda x: x.square, reverse=True)                                                       #возращаем отсортированный по площаде покрытия
\ No newline at end of file
+        next(reader, None)                                                                                  #пропускаем заголовок
+        rows = [row[:7] for row in reader if row]
+    if not rows:
+        return TowerCatalog([], [], [], [], [], [], [])
+    id_bs, name, square, frequency, type_antenna, range_of_handrover, standart = zip(*rows)
+    square = [value.replace(",", ".") for value in square]
+    return TowerCatalog(id_bs, name, np.asarray(square, dtype=np.float64),
+                        frequency, type_antenna, range_of_handrover, standart)
+
+
+def _read_sidecar(path: str, mtime_ns: int, size: int):
+    """Каталог из бинарной копии, если она есть и соответствует текущему CSV."""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if (int(data["version"]) != SIDECAR_VERSION or int(data["mtime_ns"]) != mtime_ns
+                    or int(data["size"]) != size):
+                return None
+            columns = {field: data[field] for field in Tower.__slots__}
+    except (OSError, KeyError, ValueError):
+        return None
+    return TowerCatalog(**columns)
+
+
+def _write_sidecar(path: str, catalog: TowerCatalog, mtime_ns: int, size: int) -> None:
+    tmp_path = path + ".tmp.npz"
+    try:
+        np.savez(tmp_path, version=SIDECAR_VERSION, mtime_ns=mtime_ns, size=size, **catalog._columns())
+        os.replace(tmp_path, path)
+    except OSError:
+        # Каталог только для чтения — работаем без бинарной копии
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_catalog(filename:str=DEFAULT_CATALOG, sidecar: bool = True) -> TowerCatalog:
+    """
+    Загружает каталог вышек из CSV. Результат запоминается по пути и времени изменения файла,
+    повторные вызовы не перечитывают CSV. sidecar: хранить рядом с CSV бинарную копию
+    (<имя>.npz) для мгновенной загрузки при следующих запусках.
+    """
+    path = _resolve_path(filename)
+    stat = os.stat(path)
+    cached = _catalogs.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    catalog = None
+    sidecar_path = path + ".npz"
+    if sidecar:
+        catalog = _read_sidecar(sidecar_path, stat.st_mtime_ns, stat.st_size)
+    if catalog is None:
+        catalog = _read_csv(path)
+        if sidecar:
+            _write_sidecar(sidecar_path, catalog, stat.st_mtime_ns, stat.st_size)
+    _catalogs[path] = (stat.st_mtime_ns, stat.st_size, catalog)
+    return catalog
+
+
+def parsing_base_station(filename:str=DEFAULT_CATALOG):
+    """Список вышек, отсортированный по убыванию площади покрытия (см. load_catalog)."""
+    return load_catalog(filename).towers()